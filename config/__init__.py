@@ -10,6 +10,7 @@ from .game_config import (
     ShadowConfig,
     LevelConfig,
     ENEMY_CONFIGS,
+    MAX_DETECTION_RANGE,
     SHADOW_CONFIGS,
     LEVEL_CONFIGS,
     get_enemy_config,
@@ -104,6 +104,9 @@ ENEMY_CONFIGS: dict[str, EnemyConfig] = {
     ),
 }
 
+# Largest detection range of any enemy type (bounds spatial queries)
+MAX_DETECTION_RANGE: int = max(c.detection_range for c in ENEMY_CONFIGS.values())
+
 SHADOW_CONFIGS: dict[str, ShadowConfig] = {
     'shadow': ShadowConfig(
         name='Shadow Agent',
@@ -40,6 +40,9 @@ RESPONSIVE_SCALE = min(SCREEN_WIDTH / 1920, SCREEN_HEIGHT / 1440)
 
 # --- Game Settings ---
 FPS = 60
+# Fixed simulation step (AI, cooldowns, traps); rendering runs at FPS
+SIM_STEP = 1.0 / 30
+MAX_SIM_STEPS = 5  # per frame, so a long stall cannot snowball
 START_LEVEL = 1
 MAX_LEVELS = 5
 WINDOW_RESIZABLE = True
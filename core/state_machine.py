@@ -74,24 +74,43 @@ class StateMachine:
     Usage:
         machine = StateMachine()
         machine.register(StateType.MAIN_MENU, MainMenuState(engine))
+        machine.register(StateType.PLAYING, lambda: PlayingState(engine))  # lazy
         machine.transition_to(StateType.MAIN_MENU)
     """
     
     def __init__(self):
         self._states: dict[StateType, State] = {}
+        self._factories: dict[StateType, Callable[[], State]] = {}
         self._current_state: State | None = None
         self._current_type: StateType | None = None
     
-    def register(self, state_type: StateType, state: State) -> None:
-        """Register a state with the machine."""
-        self._states[state_type] = state
+    def register(self, state_type: StateType, state: State | Callable[[], State]) -> None:
+        """
+        Register a state with the machine.
+        Accepts a State, or a factory called once on the first transition to it.
+        """
+        if isinstance(state, State):
+            self._states[state_type] = state
+            self._factories.pop(state_type, None)
+        else:
+            self._factories[state_type] = state
+            self._states.pop(state_type, None)
+    
+    def _get_state(self, state_type: StateType) -> State | None:
+        """Registered state for state_type, constructing it on first use."""
+        state = self._states.get(state_type)
+        if state is None:
+            factory = self._factories.pop(state_type, None)
+            if factory is not None:
+                state = self._states[state_type] = factory()
+        return state
     
     def transition_to(self, state_type: StateType) -> None:
         """Transition to a new state."""
         if self._current_state:
             self._current_state.exit()
         
-        self._current_state = self._states.get(state_type)
+        self._current_state = self._get_state(state_type)
         self._current_type = state_type
         
         if self._current_state:
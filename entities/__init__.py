@@ -1,8 +1,9 @@
 """Entities package for Solo Leveling game."""
 from .base_entity import BaseEntity, Position, HealthComponent, MovementComponent
-from .tile import Tile
+from .tile import Tile, TileType
 from .player import Player
 from .enemy import Enemy
 from .shadow import Shadow
 from .grid import Grid
 from .entity_factory import EntityFactory
+from .entity_list import EntityList
@@ -100,6 +100,8 @@ class BaseEntity:
     Subclasses should override update() for entity-specific logic.
     """
     
+    __slots__ = ('x', 'y', '_health', '_movement', 'asset_key', 'state', 'damage_animation_timer', 'slot')
+    
     def __init__(
         self,
         x: int,
@@ -118,6 +120,9 @@ class BaseEntity:
         # State tracking
         self.state: str = "IDLE"
         self.damage_animation_timer: float = 0.0
+        
+        # Position in the owning EntityList (-1 when not in one)
+        self.slot: int = -1
     
     # Health properties (for backward compatibility)
     @property
@@ -34,6 +34,15 @@ class Enemy(BaseEntity):
     - HUNTING: Chasing the player
     """
     
+    __slots__ = (
+        'enemy_type', 'type_name', 'damage', 'detection_range',
+        'caught_player', 'combat_timer', 'attack_next',
+        'patrol_points', 'current_patrol_index', 'patrol_wait_until',
+        'patrol_wait_duration', 'home_position',
+        'frozen_until', 'slow_until', 'slow_factor', '_speed_mult', '_speed_mult_until',
+        '_path_cache_key', '_patrol_paths', '_patrol_paths_version',
+    )
+    
     def __init__(self, x: int, y: int, enemy_type: str = 'security_agent'):
         # Get type-specific configuration (dataclass)
         config = get_enemy_config(enemy_type)
@@ -54,39 +63,109 @@ class Enemy(BaseEntity):
         self.damage = config.damage
         self.detection_range = config.detection_range
         
+        # Timers below are absolute game times (GameEngine.level_time),
+        # compared against `now` instead of being decremented every frame.
+        
         # Combat state
         self.caught_player = False
         self.combat_timer = 0.0
-        self.attack_cooldown = 0.0
+        self.attack_next: float = 0.0
         
         # Patrol state
         self.patrol_points: list[tuple[int, int]] = []
         self.current_patrol_index: int = 0
-        self.patrol_wait_timer: float = 0.0
+        self.patrol_wait_until: float = 0.0
         self.patrol_wait_duration: float = 1.5  # Wait at each patrol point
         self.home_position: tuple[int, int] = (x, y)
         
         # Status effects
-        self.frozen_timer: float = 0.0
-        self.slow_timer: float = 0.0
+        self.frozen_until: float = 0.0
+        self.slow_until: float = 0.0
         self.slow_factor: float = 1.0
+        # Movement multiplier from status effects, valid until _speed_mult_until
+        self._speed_mult: float = 1.0
+        self._speed_mult_until: float = float('inf')
+        
+        # Hunting path cache: (start, goal, grid version) of the last path lookup
+        self._path_cache_key: tuple | None = None
+        
+        # Patrol legs already planned: (start, patrol index) -> path, for one grid version
+        self._patrol_paths: dict[tuple[tuple[int, int], int], tuple[tuple[int, int], ...]] = {}
+        self._patrol_paths_version: int | None = None
         
         # Generate initial patrol route
         self._generate_patrol_route()
 
-    def apply_effect(self, effect_type: str, duration: float) -> None:
-        """Apply status effect to enemy."""
+    def apply_effect(self, effect_type: str, duration: float, now: float) -> None:
+        """Apply status effect to enemy at game time now."""
         if effect_type == 'freeze':
-            self.frozen_timer = duration
+            # Freezing pauses the other status timers: shift them by the
+            # frozen time this application adds (or cuts, as a shorter
+            # freeze replaces a longer one)
+            added = now + duration - max(self.frozen_until, now)
+            if added:
+                if self.slow_until > now:
+                    self.slow_until += added
+                if self.patrol_wait_until > now:
+                    self.patrol_wait_until += added
+            self.frozen_until = now + duration
             # Reset path when frozen to force re-evaluation after thaw
             self.path = []
+            self._path_cache_key = None
         elif effect_type == 'slow':
-            self.slow_timer = duration
+            # Status timers are paused while frozen, so the slow starts at thaw
+            start = max(now, self.frozen_until)
+            # A running patrol wait keeps what is left of it, re-timed under the new slow
+            waiting = self.patrol_wait_until > start
+            if waiting:
+                wait_left = self._wait_left(start)
+            self.slow_until = start + duration
             self.slow_factor = 0.5  # 50% slow
+            if waiting:
+                self.patrol_wait_until = self._wait_deadline(start, wait_left)
+        self._refresh_speed_mult(now)
+    
+    def _wait_deadline(self, now: float, wait: float) -> float:
+        """
+        Game time at which a patrol wait of `wait` seconds started at now ends.
+        The wait runs at slow_factor speed until the slow wears off and does
+        not run at all while frozen.
+        """
+        start = max(now, self.frozen_until)
+        slowed = self.slow_until - start
+        if slowed <= 0:
+            return start + wait
+        if slowed * self.slow_factor >= wait:
+            return start + wait / self.slow_factor
+        return start + slowed + (wait - slowed * self.slow_factor)
+    
+    def _wait_left(self, now: float) -> float:
+        """Patrol wait still to run at game time now (inverse of _wait_deadline)."""
+        start = max(now, self.frozen_until)
+        remaining = self.patrol_wait_until - start
+        if remaining <= 0:
+            return 0.0
+        slowed = max(0.0, self.slow_until - start)
+        if remaining <= slowed:
+            return remaining * self.slow_factor
+        return slowed * self.slow_factor + (remaining - slowed)
+    
+    def _refresh_speed_mult(self, now: float) -> None:
+        """Recompute the status-effect movement multiplier and when it next changes."""
+        if now < self.frozen_until:
+            self._speed_mult = 0.0
+            self._speed_mult_until = self.frozen_until
+        elif now < self.slow_until:
+            self._speed_mult = self.slow_factor
+            self._speed_mult_until = self.slow_until
+        else:
+            self._speed_mult = 1.0
+            self._speed_mult_until = float('inf')
     
     def _generate_patrol_route(self) -> None:
         """Generate random patrol points around home position."""
         self.patrol_points = [self.home_position]
+        seen = {self.home_position}
         
         # Generate 2-3 random patrol points nearby
         num_points = random.randint(2, 3)
@@ -94,66 +173,82 @@ class Enemy(BaseEntity):
             # Patrol within 3-5 tiles of home
             offset_x = random.randint(-4, 4)
             offset_y = random.randint(-4, 4)
-            patrol_x = self.home_position[0] + offset_x
-            patrol_y = self.home_position[1] + offset_y
+            point = (self.home_position[0] + offset_x, self.home_position[1] + offset_y)
             
             # Ensure it's not the same point
-            if (patrol_x, patrol_y) not in self.patrol_points:
-                self.patrol_points.append((patrol_x, patrol_y))
+            if point not in seen:
+                seen.add(point)
+                self.patrol_points.append(point)
     
-    def update(self, dt: float, player: 'Player', grid: 'Grid', pathfinding: 'Pathfinding') -> None:
-        """Update enemy AI and movement."""
+    def update(self, dt: float, now: float, player: 'Player', grid: 'Grid', pathfinding: 'Pathfinding',
+               player_detected: bool | None = None) -> None:
+        """
+        Update enemy AI and movement at game time now.
+        
+        player_detected may be precomputed by a batch scan
+        (systems.detection.detect_player); if None the enemy checks itself.
+        """
         super().update(dt)
         if self.is_dead:
             return
-            
-        # Update cooldowns
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= dt
         
-        # Manhattan distance check for detection
-        dist = abs(self.x - player.x) + abs(self.y - player.y)
+        # Player tile, cached on the player once per tick
+        px = player.ix
+        py = player.iy
+        
+        # Manhattan distance check for detection (integer arithmetic)
+        if player_detected is None:
+            player_detected = abs(self.x - px) + abs(self.y - py) < self.detection_range
         
-        if dist < self.detection_range:
+        if player_detected:
             # Player detected - hunt them!
             if self.state != "HUNTING":
-                logger.info("%s spotted player at dist %.1f! Switching to HUNTING", self.type_name, dist)
+                logger.info("%s spotted player at dist %d! Switching to HUNTING",
+                            self.type_name, abs(self.x - px) + abs(self.y - py))
                 self.state = "HUNTING"
             
-            # Recalculate path using A* algorithm
-            self.path = pathfinding.a_star(
-                (int(self.x), int(self.y)), 
-                (int(player.x), int(player.y)), 
-                grid
-            )
-            # Log path calculation for debugging
+            # Recalculate path only when the player changes tile or the layout
+            # changes. Stepping along the path keeps the remainder valid.
+            # Hunters share one reverse-Dijkstra map rooted at the player tile.
+            start = (self.x, self.y)
+            goal = (px, py)
+            last = self._path_cache_key
+            if last is not None and last[1:] == (goal, grid.version):
+                # Still following the path, or already know none exists from here
+                if self.path or last[0] == start:
+                    return
+            self._path_cache_key = (start, goal, grid.version)
+            self.path = pathfinding.shared_path_to(goal, grid, start)
+            # Log path calculation for debugging (per replan, so debug level)
             if len(self.path) > 0:
-                logger.info("%s A* path calculated. Steps: %d. Next: %s", self.type_name, len(self.path), self.path[0])
+                logger.debug("%s hunting path calculated. Steps: %d. Next: %s", self.type_name, len(self.path), self.path[0])
             else:
                 logger.warning("%s detected player but NO PATH found!", self.type_name)
         else:
             # No player nearby - patrol
             if self.state == "HUNTING":
                 # Just lost the player, return to patrol
-                logger.info("%s lost player (dist %.1f). Switching to PATROL", self.type_name, dist)
+                logger.info("%s lost player (dist %d). Switching to PATROL",
+                            self.type_name, abs(self.x - px) + abs(self.y - py))
                 self.state = "PATROL"
                 self.path = []
+                self._path_cache_key = None
             
-            self._update_patrol(grid, pathfinding)
+            self._update_patrol(now, grid, pathfinding)
     
-    def attack_player(self, player: 'Player') -> int:
+    def attack_player(self, player: 'Player', now: float) -> int:
         """
         Attack the player if cooldown allows.
         Returns damage dealt (0 if on cooldown).
         """
-        if self.attack_cooldown > 0:
+        if now < self.attack_next:
             return 0
             
         damage = player.take_damage(self.damage)
-        self.attack_cooldown = 1.0  # 1 second cooldown
+        self.attack_next = now + 1.0  # 1 second cooldown
         return damage
     
-    def _update_patrol(self, grid: 'Grid', pathfinding: 'Pathfinding') -> None:
+    def _update_patrol(self, now: float, grid: 'Grid', pathfinding: 'Pathfinding') -> None:
         """Update patrol behavior."""
         if not self.patrol_points:
             self.state = "IDLE"
@@ -165,42 +260,49 @@ class Enemy(BaseEntity):
         current_target = self.patrol_points[self.current_patrol_index]
         if self.x == current_target[0] and self.y == current_target[1]:
             # At patrol point - wait a bit
-            if self.patrol_wait_timer > 0:
+            if now < self.patrol_wait_until:
                 return  # Still waiting
             
-            # Move to next patrol point
+            # Move to next patrol point (waits stretch while slowed)
             self.current_patrol_index = (self.current_patrol_index + 1) % len(self.patrol_points)
-            self.patrol_wait_timer = self.patrol_wait_duration
+            self.patrol_wait_until = self._wait_deadline(now, self.patrol_wait_duration)
         
         # Generate path to current patrol point if needed
         if not self.path:
             target = self.patrol_points[self.current_patrol_index]
-            # Validate target is in bounds
-            if 0 <= target[0] < grid.width and 0 <= target[1] < grid.height:
-                tile = grid.get_tile(target[0], target[1])
-                if tile and tile.type != 'wall':
-                    self.path = pathfinding.a_star(
-                        (self.x, self.y),
-                        target,
-                        grid
-                    )
+            # Validate target is in bounds and not a wall
+            if grid.is_walkable(target[0], target[1]):
+                self.path = self._patrol_path_to(self.current_patrol_index, grid, pathfinding)
     
-    def move_step(self, dt: float) -> None:
-        """Move one step along the path."""
-        # Update status timers
-        if self.frozen_timer > 0:
-            self.frozen_timer -= dt
+    def _patrol_path_to(self, index: int, grid: 'Grid', pathfinding: 'Pathfinding') -> list[tuple[int, int]]:
+        """
+        Path to patrol point index, reusing legs of the patrol circuit
+        already planned for this grid version.
+        """
+        if self._patrol_paths_version != grid.version:
+            self._patrol_paths.clear()
+            self._patrol_paths_version = grid.version
+        
+        start = (self.x, self.y)
+        key = (start, index)
+        cached = self._patrol_paths.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        path = pathfinding.a_star(start, self.patrol_points[index], grid)
+        # Only legs starting on the circuit repeat; detours after a hunt do not
+        if start in self.patrol_points:
+            self._patrol_paths[key] = tuple(path)
+        return path
+    
+    def move_step(self, dt: float, now: float) -> None:
+        """Move one step along the path unless frozen."""
+        # Multiplier only changes when an effect is applied or expires
+        if now >= self._speed_mult_until:
+            self._refresh_speed_mult(now)
+        current_dt = dt * self._speed_mult
+        if not self._speed_mult:
             return  # frozen = no movement
-            
-        if self.slow_timer > 0:
-            self.slow_timer -= dt
-            current_dt = dt * self.slow_factor
-        else:
-            current_dt = dt
-            
-        # Update patrol wait timer
-        if self.patrol_wait_timer > 0:
-            self.patrol_wait_timer -= current_dt
         
         # Call parent move step with potentially modified dt (for slow)
         # Note: BaseEntity.move_step uses self.speed to determine IF it should move.
@@ -208,15 +310,15 @@ class Enemy(BaseEntity):
         # So passing smaller dt makes it move slower. Correct.
         super().move_step(current_dt)
     
-    def check_caught_player(self, player: 'Player') -> bool:
+    def check_caught_player(self, player: 'Player', now: float) -> bool:
         """Check if enemy has caught (is adjacent to) the player."""
         if self.is_dead:
             return False
         # If frozen, cannot attack
-        if self.frozen_timer > 0:
+        if now < self.frozen_until:
             return False
             
         # Manhattan distance check
-        dist = abs(self.x - player.x) + abs(self.y - player.y)
+        dist = abs(self.x - player.ix) + abs(self.y - player.iy)
         # Allow attack if adjacent (distance 1) or on same tile (distance 0)
         return dist <= 1.5
@@ -3,7 +3,7 @@ Entity factory for creating game entities.
 Centralizes entity creation logic and configuration lookup.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from functools import lru_cache
 
 from config.game_config import (
     get_enemy_config, 
@@ -11,12 +11,24 @@ from config.game_config import (
     get_level_config,
     LevelConfig
 )
+# Imported once at module scope; none of these modules import the factory
+from .enemy import Enemy
+from .shadow import Shadow
+from .player import Player
+from .grid import Grid
 
-if TYPE_CHECKING:
-    from entities.enemy import Enemy
-    from entities.shadow import Shadow
-    from entities.player import Player
-    from entities.grid import Grid
+
+@lru_cache(maxsize=None)
+def _corner_spawn_positions(total: int, grid_width: int, grid_height: int) -> tuple[tuple[int, int], ...]:
+    """
+    Diagonal spawn slots spreading out from the far corner.
+    Clamped inside the border walls; cached per (count, grid size).
+    """
+    return tuple(
+        (max(1, min(grid_width - 2, grid_width - 3 - i * 2)),
+         max(1, min(grid_height - 2, grid_height - 3 - i * 2)))
+        for i in range(total)
+    )
 
 
 class EntityFactory:
@@ -42,7 +54,6 @@ class EntityFactory:
         Returns:
             Configured Enemy instance
         """
-        from entities.enemy import Enemy
         return Enemy(x, y, enemy_type=enemy_type)
     
     @staticmethod
@@ -58,7 +69,6 @@ class EntityFactory:
         Returns:
             Configured Shadow instance
         """
-        from entities.shadow import Shadow
         return Shadow(x, y, shadow_type=shadow_type)
     
     @staticmethod
@@ -74,7 +84,6 @@ class EntityFactory:
         Returns:
             Configured Player instance
         """
-        from entities.player import Player
         player = Player(x, y)
         player.resources = resources
         return player
@@ -92,7 +101,6 @@ class EntityFactory:
         Returns:
             Configured Grid instance
         """
-        from entities.grid import Grid
         return Grid(width, height, level=level)
     
     @staticmethod
@@ -108,18 +116,16 @@ class EntityFactory:
         Returns:
             List of Enemy instances positioned on the grid
         """
-        from entities.enemy import Enemy
-        
-        enemies = []
-        enemy_index = 0
         
-        for enemy_type, count in level_config.enemies:
-            for _ in range(count):
-                # Position enemies in the far corner, spread out
-                ex = grid_width - 3 - enemy_index * 2
-                ey = grid_height - 3 - enemy_index * 2
-                enemy = Enemy(ex, ey, enemy_type=enemy_type)
-                enemies.append(enemy)
-                enemy_index += 1
+        enemy_types = [
+            enemy_type
+            for enemy_type, count in level_config.enemies
+            for _ in range(count)
+        ]
+        # Position enemies in the far corner, spread out
+        positions = _corner_spawn_positions(len(enemy_types), grid_width, grid_height)
         
-        return enemies
+        return [
+            Enemy(ex, ey, enemy_type=enemy_type)
+            for enemy_type, (ex, ey) in zip(enemy_types, positions)
+        ]
@@ -0,0 +1,41 @@
+"""
+Entity list with constant-time removal.
+"""
+from __future__ import annotations
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_entity import BaseEntity
+
+
+class EntityList(list):
+    """
+    List of entities that removes members by swap-and-pop.
+
+    Each member's position is kept in entity.slot, so swap_remove needs
+    no search. Order is not preserved. Only append, pop() of the last
+    member and swap_remove keep slots valid.
+
+    Usage:
+        enemies = EntityList(spawned)
+        enemies.append(enemy)
+        enemies.swap_remove(dead_enemy)
+    """
+
+    def __init__(self, entities: Iterable[BaseEntity] = ()):
+        super().__init__(entities)
+        for slot, entity in enumerate(self):
+            entity.slot = slot
+
+    def append(self, entity: BaseEntity) -> None:
+        """Add an entity at the end, recording its slot."""
+        entity.slot = len(self)
+        super().append(entity)
+
+    def swap_remove(self, entity: BaseEntity) -> None:
+        """Remove entity by moving the last member into its slot."""
+        slot = entity.slot
+        last = super().pop()
+        if last is not entity:
+            self[slot] = last
+            last.slot = slot
@@ -2,7 +2,8 @@
 Grid entity managing the game level layout.
 """
 import random
-from .tile import Tile
+from array import array
+from .tile import Tile, TileType
 
 class Grid:
     """Game level grid with procedural generation."""
@@ -11,7 +12,20 @@ class Grid:
         self.width = width
         self.height = height
         self.level = level
-        self.tiles = [[Tile(x, y) for y in range(height)] for x in range(width)]
+        # Bumped on every layout change so cached paths can be invalidated
+        self.version: int = 0
+        # Flat tile-type codes, indexed x * height + y (see entities.tile.TileType)
+        self.type_map = bytearray(width * height)
+        # Movement cost and fog-of-war flag per tile, same indexing
+        self.cost_map = array('H', [1]) * (width * height)
+        self.visible_map = bytearray(width * height)
+        # Trap timers, same indexing
+        self.trap_cooldown_map = array('d', [0.0]) * (width * height)
+        self.trap_triggered_map = bytearray(width * height)
+        # Indices whose trap cooldown is still running (see update_tiles)
+        self.ticking: set[int] = set()
+        # Tile views are created on first access (see get_tile)
+        self._tiles: list[Tile | None] = [None] * (width * height)
         
         if layout:
             self._apply_layout(layout)
@@ -23,36 +37,100 @@ class Grid:
         for x in range(min(self.width, len(layout))):
             for y in range(min(self.height, len(layout[0]))):
                 if layout[x][y]:
-                    self.get_tile(x, y).type = 'wall'
+                    self.type_map[x * self.height + y] = TileType.WALL
+        self.mark_changed()
     
     def generate_level(self):
         """Simple random generation (fallback)."""
-        # Add some random walls for obstacle variety
+        # Add some random walls for obstacle variety, sampled in one batch
         num_walls = max(3, self.width // 4)
-        for _ in range(num_walls):
-            wx = random.randint(1, self.width - 2)
-            wy = random.randint(1, self.height - 2)
-            self.get_tile(wx, wy).type = 'wall'
+        xs = random.choices(range(1, self.width - 1), k=num_walls)
+        ys = random.choices(range(1, self.height - 1), k=num_walls)
+        for wx, wy in zip(xs, ys):
+            self.type_map[wx * self.height + wy] = TileType.WALL
+        self.mark_changed()
+    
+    def mark_changed(self):
+        """Bump the layout version after tiles are modified."""
+        self.version += 1
+    
+    def start_ticking(self, x, y):
+        """Have update_tiles tick (x, y) until its trap cooldown runs out."""
+        self.ticking.add(x * self.height + y)
+    
+    def update_tiles(self, dt):
+        """
+        Tick the trap cooldowns registered with start_ticking.
+        Equivalent to calling Tile.update(dt) on each tile, as long as every
+        trap that starts a cooldown is registered.
+        """
+        if not self.ticking:
+            return
+        cooldowns = self.trap_cooldown_map
+        triggered = self.trap_triggered_map
+        finished = []
+        for index in self.ticking:
+            cooldown = cooldowns[index]
+            if cooldown > 0:
+                cooldown -= dt
+                cooldowns[index] = cooldown
+            if cooldown <= 0:
+                triggered[index] = False
+                finished.append(index)
+        self.ticking.difference_update(finished)
     
     def get_tile(self, x, y):
-        """Get tile at coordinates, returns None if out of bounds."""
+        """
+        Get tile at coordinates, returns None if out of bounds.
+        The Tile view is built on first access and reused afterwards.
+        """
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[x][y]
+            index = x * self.height + y
+            tile = self._tiles[index]
+            if tile is None:
+                tile = self._tiles[index] = Tile(
+                    x, y, self.type_map, index, self.cost_map, self.visible_map,
+                    self.trap_cooldown_map, self.trap_triggered_map
+                )
+            return tile
         return None
     
+    def is_walkable(self, x, y):
+        """True if (x, y) is in bounds and not a wall."""
+        return 0 <= x < self.width and 0 <= y < self.height and self.type_map[x * self.height + y] != TileType.WALL
+    
+    def find_tile(self, code):
+        """
+        Coordinates (x, y) of the first tile of the given TileType code,
+        or None if there is none. Scans type_map in C via bytearray.find.
+        """
+        index = self.type_map.find(code)
+        if index < 0:
+            return None
+        return divmod(index, self.height)
+    
+    def has_uniform_cost(self):
+        """True if every walkable tile costs the same to enter (no traps)."""
+        return TileType.TRAP not in self.type_map
+    
     def place_resources(self, count):
-        """Place resources randomly on the grid."""
-        placed = 0
-        while placed < count:
-            rx = random.randint(3, self.width - 3)
-            ry = random.randint(3, self.height - 3)
-            tile = self.get_tile(rx, ry)
-            if tile and tile.type == 'floor':
-                tile.type = 'resource'
-                placed += 1
+        """
+        Place resources randomly on the grid.
+        Samples distinct floor tiles in one batch (fewer if the area runs out).
+        """
+        floor_indices = [
+            x * self.height + y
+            for x in range(3, self.width - 2)
+            for y in range(3, self.height - 2)
+            if self.type_map[x * self.height + y] == TileType.FLOOR
+        ]
+        for index in random.sample(floor_indices, min(count, len(floor_indices))):
+            self.type_map[index] = TileType.RESOURCE
+        self.mark_changed()
     
     def place_exit(self):
         """Place exit in far corner."""
         ex = self.width - 3
         ey = self.height - 3
-        self.get_tile(ex, ey).type = 'exit'
+        self.type_map[ex * self.height + ey] = TileType.EXIT
+        self.mark_changed()
@@ -6,6 +6,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from core.logger import get_logger
+from entities.tile import TileType
 
 if TYPE_CHECKING:
     from entities.grid import Grid
@@ -13,13 +14,48 @@ if TYPE_CHECKING:
 # Module logger
 logger = get_logger('player')
 
+# Squared attack radii (compare squared distances, no sqrt)
+MELEE_RANGE_SQ = 1.5 * 1.5      # adjacent or diagonal (~1.414)
+DAGGER_HIT_RADIUS_SQ = 1.0      # enemy must be within 1 tile of the target
+DAGGER_RANGE_SQ = 4.5 * 4.5     # max throw distance from the player
+
+
+def _collect_resource(player: 'Player', tile) -> None:
+    """Pick up the data node on a resource tile."""
+    tile.code = TileType.FLOOR
+    player.resources += 10
+    logger.info("Data Collected! Resources: %d", player.resources)
+
+
+def _reach_exit(player: 'Player', tile) -> None:
+    """Player stepped onto the exit."""
+    logger.info("LEVEL COMPLETE - UPLOAD SUCCESSFUL")
+
+
+# Arrival handlers keyed by tile type code
+_TILE_HANDLERS = {
+    TileType.RESOURCE: _collect_resource,
+    TileType.EXIT: _reach_exit,
+}
+
 
 class Player:
     """Main player character with smooth movement interpolation."""
     
+    __slots__ = (
+        'x', 'y', 'ix', 'iy', 'resources', 'health', 'max_health', 'damage',
+        'moving', 'move_start', 'move_target', 'move_progress', 'move_duration', 'path',
+        'attack_ready_at', 'damage_animation_timer',
+    )
+    
     def __init__(self, x: int, y: int) -> None:
-        self.x: int | float = x
-        self.y: int | float = y
+        # Logical tile; only ever an int (rendering interpolates from
+        # move_start/move_progress, never through x/y)
+        self.x: int = int(x)
+        self.y: int = int(y)
+        # Same tile, cached under the names per-enemy reads use
+        self.ix: int = self.x
+        self.iy: int = self.y
         self.resources: int = 10  # Starting 'Data'
         
         # Combat stats (Hell Mode)
@@ -29,14 +65,14 @@ class Player:
         
         # Movement interpolation state (for smooth movement)
         self.moving: bool = False
-        self.move_start: tuple[int | float, int | float] = (x, y)
-        self.move_target: tuple[int | float, int | float] = (x, y)
+        self.move_start: tuple[int, int] = (self.x, self.y)
+        self.move_target: tuple[int, int] = (self.x, self.y)
         self.move_progress: float = 0.0
         self.move_duration: float = 0.12  # seconds per tile
         self.path: list[tuple[int, int]] = []
         
-        # Combat logic
-        self.attack_cooldown: float = 0.0
+        # Combat logic (attack_ready_at is absolute level time)
+        self.attack_ready_at: float = 0.0
         self.damage_animation_timer: float = 0.0
         
     @property
@@ -66,21 +102,31 @@ class Player:
         Returns:
             True if movement started, False otherwise
         """
-        new_x = int(self.x) + dx
-        new_y = int(self.y) + dy
-        
-        if 0 <= new_x < grid.width and 0 <= new_y < grid.height:
-            tile = grid.get_tile(new_x, new_y)
-            if tile and tile.type != 'wall':
-                # Start interpolated movement rather than teleport
-                if not self.moving:
-                    self.moving = True
-                    self.move_start = (self.x, self.y)
-                    self.move_target = (new_x, new_y)
-                    self.move_progress = 0.0
-                    return True
+        # Mid-move is the common case while a key is held; skip the tile checks
+        if self.moving:
+            return False
+        
+        # Not moving, so the cached tile is the current position
+        new_x = self.ix + dx
+        new_y = self.iy + dy
+        
+        # Bounds and walls in one type-map lookup
+        if grid.is_walkable(new_x, new_y):
+            # Start interpolated movement rather than teleport
+            self.moving = True
+            self.move_start = (self.x, self.y)
+            self.move_target = (new_x, new_y)
+            self.move_progress = 0.0
+            return True
         return False
     
+    def visual_progress(self, lookahead: float = 0.0) -> float:
+        """
+        Move progress for drawing, extrapolated lookahead seconds past the
+        last simulation step and clamped to [0, 1].
+        """
+        return max(0.0, min(1.0, self.move_progress + lookahead / max(self.move_duration, 1e-6)))
+    
     def update(self, dt: float, grid: 'Grid') -> None:
         """
         Update player state (movement interpolation).
@@ -94,87 +140,84 @@ class Player:
             self.move_progress += dt / max(self.move_duration, 1e-6)
             if self.move_progress >= 1.0:
                 # Finish movement
-                self.x, self.y = self.move_target
+                self.x, self.y = self.ix, self.iy = self.move_target
                 self.moving = False
                 
                 # Interact with tile after movement
-                tile = grid.get_tile(int(self.x), int(self.y))
+                tile = grid.get_tile(self.ix, self.iy)
                 if tile:
-                    if tile.type == 'resource':
-                        tile.type = 'floor'
-                        self.resources += 10
-                        logger.info("Data Collected! Resources: %d", self.resources)
-                    elif tile.type == 'exit':
-                        logger.info("LEVEL COMPLETE - UPLOAD SUCCESSFUL")
-        
-        # Cooldown management
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= dt
-            
+                    handler = _TILE_HANDLERS.get(tile.code)
+                    if handler:
+                        handler(self, tile)
+        
         # Animation timer
         if self.damage_animation_timer > 0:
             self.damage_animation_timer -= dt
             
-    def attack(self, enemies: list) -> list:
+    def attack(self, enemies: list, now: float) -> list:
         """
         Perform melee attack on adjacent enemies.
         
         Args:
-            enemies: List of active enemies
+            enemies: Candidate enemies (e.g. a spatial index query)
+            now: Current level time
             
         Returns:
             List of enemies hit
         """
-        if self.attack_cooldown > 0:
+        if now < self.attack_ready_at:
             return []
             
-        self.attack_cooldown = 0.5
-        hit_enemies = []
-        
-        for enemy in enemies:
-            # Check distance (adjacent or diagonal = ~1.414)
-            dist = ((self.x - enemy.x)**2 + (self.y - enemy.y)**2)**0.5
-            if dist <= 1.5:
-                enemy.take_damage(self.damage)
-                hit_enemies.append(enemy)
+        self.attack_ready_at = now + 0.5
+        
+        # Build the hit mask in one pass (adjacent or diagonal = ~1.414),
+        # then apply damage only to the enemies it selects
+        px, py = self.x, self.y
+        hit_enemies = [
+            enemy for enemy in enemies
+            if (px - enemy.x) * (px - enemy.x) + (py - enemy.y) * (py - enemy.y) <= MELEE_RANGE_SQ
+        ]
+        for enemy in hit_enemies:
+            enemy.take_damage(self.damage)
                 
         return hit_enemies
         
-    def skill_dagger_throw(self, target_pos: tuple[int, int], enemies: list):
+    def skill_dagger_throw(self, target_pos: tuple[int, int], enemies: list, now: float):
         """
         Perform ranged dagger throw at target position.
         
         Args:
             target_pos: Tuple (x, y) of target tile
-            enemies: List of active enemies
+            enemies: Candidate enemies (e.g. a spatial index query)
+            now: Current level time
             
         Returns:
             Enemy hit or None
         """
-        if self.attack_cooldown > 0:
+        if now < self.attack_ready_at:
             return None
             
-        self.attack_cooldown = 1.0
+        self.attack_ready_at = now + 1.0
         
         tx, ty = target_pos
+        px, py = self.x, self.y
         
+        # Single pass combining both circle tests on one load of the enemy
+        # position; first enemy that passes is hit:
+        # 1. Enemy is close to target_pos (hit radius)
+        # 2. Enemy is within range of player (max 4.5 tiles)
+        hit_enemy = None
         for enemy in enemies:
-            # Check distance to target tile (relaxed hit detection)
-            dist_to_target = ((enemy.x - tx)**2 + (enemy.y - ty)**2)**0.5
-            
-            # Revised logic:
-            # 1. Check if enemy is close to target_pos (hit radius)
-            # 2. Check if enemy is within range of player
-            
-            if dist_to_target < 1.0:
-                 # Range check (max 4.5 tiles)
-                dist_p = ((self.x - enemy.x)**2 + (self.y - enemy.y)**2)**0.5
-                if dist_p <= 4.5:  # Slightly increased range
-                    damage = self.damage * 2  # Double damage skill
-                    enemy.take_damage(damage)
-                    return enemy
-                    
-        return None
+            ex, ey = enemy.x, enemy.y
+            if ((ex - tx) * (ex - tx) + (ey - ty) * (ey - ty) < DAGGER_HIT_RADIUS_SQ and
+                    (ex - px) * (ex - px) + (ey - py) * (ey - py) <= DAGGER_RANGE_SQ):
+                hit_enemy = enemy
+                break
+        
+        if hit_enemy is not None:
+            damage = self.damage * 2  # Double damage skill
+            hit_enemy.take_damage(damage)
+        return hit_enemy
     
     def start_move_to(self, tx: int, ty: int, grid: 'Grid') -> bool:
         """
@@ -188,15 +231,12 @@ class Player:
         Returns:
             True if movement started, False otherwise
         """
-        if 0 <= tx < grid.width and 0 <= ty < grid.height:
-            tile = grid.get_tile(tx, ty)
-            if tile and tile.type != 'wall':
-                if not self.moving:
-                    self.moving = True
-                    self.move_start = (self.x, self.y)
-                    self.move_target = (tx, ty)
-                    self.move_progress = 0.0
-                    return True
+        if not self.moving and grid.is_walkable(tx, ty):
+            self.moving = True
+            self.move_start = (self.x, self.y)
+            self.move_target = (tx, ty)
+            self.move_progress = 0.0
+            return True
         return False
     
     def __repr__(self) -> str:
@@ -4,6 +4,7 @@ Refactored to use BaseEntity for common functionality.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import itertools
 
 from .base_entity import BaseEntity
 from config.game_config import get_shadow_config
@@ -14,6 +15,15 @@ if TYPE_CHECKING:
     from .grid import Grid
     from systems.pathfinding import Pathfinding
 
+# Minimum seconds between replans while the goal keeps moving (5 Hz)
+REPLAN_INTERVAL = 0.2
+# Tiles the current target may drift before the closest enemy is re-picked
+RETARGET_DISTANCE = 2
+
+# Increasing summon numbers; EntityList reorders on removal, so list
+# position does not tell which shadow is newest
+_summon_numbers = itertools.count()
+
 
 class Shadow(BaseEntity):
     """
@@ -44,11 +54,18 @@ class Shadow(BaseEntity):
         self.type_name = config.name
         self.cost = config.cost
         self.damage = config.damage
+        self.summon_number = next(_summon_numbers)
         
-        # Combat state
+        # Combat state (combat_ready_at is absolute level time)
         self.target_enemy: Enemy | None = None
-        self.combat_cooldown = 0.0
+        self.combat_ready_at = 0.0
         self.damage_animation_timer = 0.0
+        
+        # Path cache: (goal, grid version) of the last plan, time since it
+        self._last_plan_target = None
+        self._replan_accum = 0.0
+        # Where the current target stood when it was picked
+        self._target_pos: tuple[int, int] | None = None
     
     def take_damage(self, damage: int) -> bool:
         """
@@ -59,7 +76,7 @@ class Shadow(BaseEntity):
         self.damage_animation_timer = 0.2  # Show damage for 0.2 seconds
         return self.is_dead
     
-    def attack_enemy(self, enemy: Enemy) -> bool:
+    def attack_enemy(self, enemy: Enemy, now: float) -> bool:
         """
         Attack an enemy at the same location.
         Returns True if damage was dealt.
@@ -70,30 +87,32 @@ class Shadow(BaseEntity):
             return False
         
         damage_dealt = enemy.take_damage(self.damage)
-        self.combat_cooldown = 0.3  # Attack cooldown
+        self.combat_ready_at = now + 0.3  # Attack cooldown
         return damage_dealt > 0
     
     def update(
         self, 
         dt: float, 
+        now: float, 
         player: Player, 
         enemies: list[Enemy], 
         grid: Grid, 
         pathfinding: Pathfinding
     ) -> None:
-        """Update shadow behavior based on state."""
+        """Update shadow behavior at game time now, based on state."""
         if self.is_dead:
             return
         
         # Update timers
         self._movement.update_timer(dt)
-        self.combat_cooldown = max(0, self.combat_cooldown - dt)
-        self.damage_animation_timer = max(0, self.damage_animation_timer - dt)
+        if self.damage_animation_timer > 0:
+            self.damage_animation_timer -= dt
+        self._replan_accum += dt
         
         if self.state == "IDLE":
             self._update_idle_state(player, pathfinding, grid)
         elif self.state == "ATTACK":
-            self._update_attack_state(enemies, pathfinding, grid)
+            self._update_attack_state(now, enemies, pathfinding, grid)
         
         # Move along path if timer ready
         if self._movement.can_move():
@@ -111,42 +130,64 @@ class Shadow(BaseEntity):
         """Follow player, stay within 2 tiles."""
         dist_to_player = abs(self.x - player.x) + abs(self.y - player.y)
         if dist_to_player > 2:
-            self.path = pathfinding.a_star(
-                (self.x, self.y), 
-                (int(player.x), int(player.y)), 
-                grid
-            )
+            self._plan_path((player.x, player.y), pathfinding, grid)
+    
+    def _plan_path(
+        self, 
+        goal: tuple[int, int], 
+        pathfinding: Pathfinding, 
+        grid: Grid
+    ) -> None:
+        """
+        Path towards goal, reusing the cached one while it still applies.
+        Replans when the goal tile or the grid changes, at most every
+        REPLAN_INTERVAL seconds unless the current path has run out.
+        """
+        key = (goal, grid.version)
+        if self.path and key == self._last_plan_target:
+            return
+        if self._replan_accum < REPLAN_INTERVAL and (self.path or key == self._last_plan_target):
+            return
+        
+        self.path = pathfinding.a_star((self.x, self.y), goal, grid)
+        self._last_plan_target = key
+        self._replan_accum = 0.0
     
     def _update_attack_state(
         self, 
+        now: float, 
         enemies: list[Enemy], 
         pathfinding: Pathfinding, 
         grid: Grid
     ) -> None:
         """Hunt closest enemy."""
-        alive_enemies = [e for e in enemies if not e.is_dead]
+        # Keep the current target unless it died or drifted too far
+        target = self.target_enemy
+        if (target is None or target.is_dead or 
+                abs(target.x - self._target_pos[0]) + abs(target.y - self._target_pos[1]) > RETARGET_DISTANCE):
+            # Closest alive enemy in one pass, without building a filtered list
+            sx, sy = self.x, self.y
+            target = min(
+                (e for e in enemies if not e.is_dead),
+                key=lambda e: abs(sx - e.x) + abs(sy - e.y),
+                default=None
+            )
+            if target is None:
+                self.state = "IDLE"
+                self.path = []
+                self.target_enemy = None
+                self._target_pos = None
+                return
+            self.target_enemy = target
+            self._target_pos = (target.x, target.y)
         
-        if not alive_enemies:
-            self.state = "IDLE"
-            self.path = []
-            self.target_enemy = None
+        if now < self.combat_ready_at:
             return
         
-        # Find closest alive enemy
-        self.target_enemy = min(
-            alive_enemies, 
-            key=lambda e: abs(self.x - e.x) + abs(self.y - e.y)
-        )
-        
         dist_to_target = abs(self.x - self.target_enemy.x) + abs(self.y - self.target_enemy.y)
-        
-        if dist_to_target <= 1 and self.combat_cooldown <= 0:
+        if dist_to_target <= 1:
             # Adjacent to enemy - attack
-            self.attack_enemy(self.target_enemy)
-        elif self.combat_cooldown <= 0:
+            self.attack_enemy(self.target_enemy, now)
+        else:
             # Move toward enemy
-            self.path = pathfinding.a_star(
-                (self.x, self.y), 
-                (self.target_enemy.x, self.target_enemy.y), 
-                grid
-            )
+            self._plan_path((self.target_enemy.x, self.target_enemy.y), pathfinding, grid)
@@ -4,7 +4,9 @@ Enhanced with trap mechanics.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from array import array
 from dataclasses import dataclass
+from enum import IntEnum
 
 if TYPE_CHECKING:
     from entities.enemy import Enemy
@@ -13,6 +15,20 @@ if TYPE_CHECKING:
 
 from config.settings import TRAP_TYPES
 
+class TileType(IntEnum):
+    """Tile type codes stored in Grid.type_map (one byte per tile)."""
+    FLOOR = 0
+    WALL = 1
+    RESOURCE = 2
+    EXIT = 3
+    TRAP = 4
+
+
+# String names used by Tile.type, indexed by code
+TILE_TYPES = tuple(t.name.lower() for t in TileType)
+TILE_CODES = {name: TileType(code) for code, name in enumerate(TILE_TYPES)}
+
+
 @dataclass
 class TrapConfig:
     """Configuration for trap behavior."""
@@ -20,19 +36,96 @@ class TrapConfig:
 
 
 class Tile:
-    """Represents a single tile in the game grid."""
+    """
+    Represents a single tile in the game grid.
+    
+    The tile type, movement cost, visibility and trap timers live in the
+    owning grid's flat per-tile maps; the Tile object is a proxy that
+    reads and writes its slot there.
+    """
     
-    def __init__(self, x: int, y: int):
+    __slots__ = (
+        'x', 'y', '_index', '_type_map', '_cost_map', '_visible_map',
+        '_trap_cooldown_map', '_trap_triggered_map', 'trap_type',
+    )
+    
+    def __init__(
+        self, 
+        x: int, 
+        y: int, 
+        type_map: bytearray | None = None, 
+        index: int = 0,
+        cost_map: array | None = None,
+        visible_map: bytearray | None = None,
+        trap_cooldown_map: array | None = None,
+        trap_triggered_map: bytearray | None = None
+    ):
         self.x = x
         self.y = y
-        self.type: str = 'floor'  # floor, wall, trap, resource, exit
-        self.cost: int = 1  # Movement cost for pathfinding
-        self.visible: bool = False  # Fog of War visibility
+        self._index = index
+        # Standalone tiles get private one-slot maps
+        self._type_map = type_map if type_map is not None else bytearray(1)
+        self._cost_map = cost_map if cost_map is not None else array('H', [1])
+        self._visible_map = visible_map if visible_map is not None else bytearray(1)
+        self._trap_cooldown_map = trap_cooldown_map if trap_cooldown_map is not None else array('d', [0.0])
+        self._trap_triggered_map = trap_triggered_map if trap_triggered_map is not None else bytearray(1)
         
         # Trap state
         self.trap_type: str | None = None
-        self.trap_cooldown: float = 0.0
-        self.trap_triggered: bool = False
+    
+    @property
+    def type(self) -> str:
+        """Tile type: floor, wall, trap, resource, exit."""
+        return TILE_TYPES[self._type_map[self._index]]
+    
+    @type.setter
+    def type(self, value: str) -> None:
+        self._type_map[self._index] = TILE_CODES[value]
+    
+    @property
+    def code(self) -> int:
+        """Tile type as a TileType code (int compare, no string lookup)."""
+        return self._type_map[self._index]
+    
+    @code.setter
+    def code(self, value: TileType) -> None:
+        self._type_map[self._index] = value
+    
+    @property
+    def cost(self) -> int:
+        """Movement cost for pathfinding."""
+        return self._cost_map[self._index]
+    
+    @cost.setter
+    def cost(self, value: int) -> None:
+        self._cost_map[self._index] = value
+    
+    @property
+    def visible(self) -> bool:
+        """Fog of War visibility."""
+        return bool(self._visible_map[self._index])
+    
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._visible_map[self._index] = value
+    
+    @property
+    def trap_cooldown(self) -> float:
+        """Seconds until the trap can fire again."""
+        return self._trap_cooldown_map[self._index]
+    
+    @trap_cooldown.setter
+    def trap_cooldown(self, value: float) -> None:
+        self._trap_cooldown_map[self._index] = value
+    
+    @property
+    def trap_triggered(self) -> bool:
+        """True while the trap is in its post-trigger cooldown."""
+        return bool(self._trap_triggered_map[self._index])
+    
+    @trap_triggered.setter
+    def trap_triggered(self, value: bool) -> None:
+        self._trap_triggered_map[self._index] = value
     
     def update(self, dt: float) -> None:
         """Update tile state."""
@@ -2,11 +2,18 @@
 Main game engine orchestrating all systems.
 Refactored to use StateMachine pattern for game states.
 """
+import random
+import time
+from functools import cached_property
+
 import pygame
-from config import *
-from entities import Grid, Player, Enemy, Shadow
-from managers import AssetManager, SoundManager
-from systems import Pathfinding
+from config import (
+    FPS, GAME_TITLE, MAX_SIM_STEPS, RESPONSIVE_SCALE, SCREEN_WIDTH, SCREEN_HEIGHT,
+    SIM_STEP, START_LEVEL, WINDOW_FULLSCREEN, WINDOW_RESIZABLE,
+)
+from entities import Grid, Player, Enemy, Shadow, EntityList
+from managers import AssetManager, SoundManager, get_font
+from systems import Pathfinding, SpatialIndex
 from rendering import Camera, Renderer
 from ui import HUD, Minimap, ShadowMenu, MenuScreens
 from core.state_machine import StateMachine, StateType
@@ -39,9 +46,9 @@ class GameEngine:
         self.clock = pygame.time.Clock()
         
         # Fonts
-        self.font = pygame.font.SysFont('Arial', max(16, int(20 * RESPONSIVE_SCALE)))
-        self.small_font = pygame.font.SysFont('Arial', max(10, int(12 * RESPONSIVE_SCALE)))
-        self.large_font = pygame.font.SysFont('Arial', max(30, int(40 * RESPONSIVE_SCALE)), bold=True)
+        self.font = get_font('Arial', max(16, int(20 * RESPONSIVE_SCALE)))
+        self.small_font = get_font('Arial', max(10, int(12 * RESPONSIVE_SCALE)))
+        self.large_font = get_font('Arial', max(30, int(40 * RESPONSIVE_SCALE)), bold=True)
         
         # Managers
         self.assets = AssetManager()
@@ -52,19 +59,14 @@ class GameEngine:
         self.camera = Camera()
         self.renderer = Renderer(self.assets)
         
-        # UI Components
-        self.hud = HUD(self.font)
-        self.minimap = Minimap()
-        from ui.trap_menu import TrapMenu  # Local import to avoid circular dependency
-        self.trap_menu = TrapMenu(self.assets, self.font, self.small_font, self.large_font)
-        self.shadow_menu = ShadowMenu(self.assets, self.font, self.small_font, self.large_font)
-        self.main_menu = MenuScreens(self.font, self.large_font)
-        self.menu_screens = self.main_menu  # Alias for compatibility
+        # UI components are built on first use (see the cached properties below)
         
         # Game data
         self.current_level = START_LEVEL
         self.level_time = 0.0
         self.enemy_timer = 0.0
+        # Simulation time not yet stepped, for interpolating the render
+        self.sim_lag = 0.0
         
         # Track current screen size for responsive resizing
         self.current_screen_width = SCREEN_WIDTH
@@ -73,8 +75,12 @@ class GameEngine:
         # Entity data
         self.grid = None
         self.player = None
-        self.enemies = []
-        self.shadows = []
+        self.enemies = EntityList()
+        self.shadows = EntityList()
+        self.enemy_index = SpatialIndex()
+        
+        # Level placement RNG, seeded once for the whole session
+        self._rng = random.Random(time.time_ns())
         
         # Damage numbers
         from ui import get_damage_manager, get_combat_manager
@@ -89,6 +95,33 @@ class GameEngine:
         
         logger.info("Game engine initialized")
     
+    # UI Components
+    @cached_property
+    def hud(self) -> HUD:
+        return HUD(self.font)
+    
+    @cached_property
+    def minimap(self) -> Minimap:
+        return Minimap()
+    
+    @cached_property
+    def trap_menu(self):
+        from ui.trap_menu import TrapMenu  # Local import to avoid circular dependency
+        return TrapMenu(self.assets, self.font, self.small_font, self.large_font)
+    
+    @cached_property
+    def shadow_menu(self) -> ShadowMenu:
+        return ShadowMenu(self.assets, self.font, self.small_font, self.large_font)
+    
+    @cached_property
+    def main_menu(self) -> MenuScreens:
+        return MenuScreens(self.font, self.large_font)
+    
+    @property
+    def menu_screens(self) -> MenuScreens:
+        """Alias for compatibility."""
+        return self.main_menu
+    
     def _setup_state_machine(self):
         """Initialize and register all game states."""
         from states import (
@@ -98,24 +131,20 @@ class GameEngine:
         
         self.state_machine = StateMachine()
         
-        # Register all states
-        self.state_machine.register(StateType.MAIN_MENU, MainMenuState(self))
-        self.state_machine.register(StateType.PLAYING, PlayingState(self))
-        self.state_machine.register(StateType.PAUSED, PausedState(self))
-        self.state_machine.register(StateType.LEVEL_COMPLETE, LevelCompleteState(self))
-        self.state_machine.register(StateType.GAME_OVER, GameOverState(self))
-        self.state_machine.register(StateType.VICTORY, VictoryState(self))
+        # Register all states; each is constructed on its first transition
+        self.state_machine.register(StateType.MAIN_MENU, lambda: MainMenuState(self))
+        self.state_machine.register(StateType.PLAYING, lambda: PlayingState(self))
+        self.state_machine.register(StateType.PAUSED, lambda: PausedState(self))
+        self.state_machine.register(StateType.LEVEL_COMPLETE, lambda: LevelCompleteState(self))
+        self.state_machine.register(StateType.GAME_OVER, lambda: GameOverState(self))
+        self.state_machine.register(StateType.VICTORY, lambda: VictoryState(self))
         
         # Start at main menu
         self.state_machine.transition_to(StateType.MAIN_MENU)
     
     def init_level(self, level_num: int) -> None:
         """Initialize a new level with randomized positions."""
-        import random
-        import time
-        
-        # Seed random with current time for truly random positions each run/level
-        random.seed(time.time())
+        rng = self._rng
         
         config = get_level_config(level_num)
         if config is None:
@@ -141,9 +170,8 @@ class GameEngine:
         
         # Player spawns near top-left of region
         if largest_region:
-            # Sort by distance from (2,2) to find a good starting spot
-            sorted_by_start = sorted(largest_region, key=lambda p: (p[0]**2 + p[1]**2))
-            spawn_x, spawn_y = sorted_by_start[0]
+            # Closest point to the top-left corner is a good starting spot
+            spawn_x, spawn_y = min(largest_region, key=lambda p: p[0] * p[0] + p[1] * p[1])
         else:
             spawn_x, spawn_y = 2, 2
         
@@ -157,11 +185,10 @@ class GameEngine:
                             if abs(p[0]-spawn_x) + abs(p[1]-spawn_y) > config.grid_size // 2]
             if far_candidates:
                 # Randomly pick from far candidates for variety
-                exit_x, exit_y = random.choice(far_candidates)
+                exit_x, exit_y = rng.choice(far_candidates)
             else:
                 # Fallback to farthest point
-                sorted_by_dist = sorted(largest_region, key=lambda p: abs(p[0]-spawn_x) + abs(p[1]-spawn_y), reverse=True)
-                exit_x, exit_y = sorted_by_dist[0]
+                exit_x, exit_y = max(largest_region, key=lambda p: abs(p[0]-spawn_x) + abs(p[1]-spawn_y))
             exit_tile = self.grid.get_tile(exit_x, exit_y)
             if exit_tile:
                 exit_tile.type = 'exit'
@@ -172,7 +199,7 @@ class GameEngine:
         self.grid.place_resources(config.resource_count)
         
         # Create enemies at random positions (far from player)
-        self.enemies = []
+        self.enemies = EntityList()
         if largest_region:
             # Get candidates far from player and exit
             enemy_candidates = [p for p in largest_region 
@@ -180,8 +207,9 @@ class GameEngine:
             # Remove exit position from candidates
             if (exit_x, exit_y) in enemy_candidates:
                 enemy_candidates.remove((exit_x, exit_y))
-            # Shuffle for randomness
-            random.shuffle(enemy_candidates)
+            # Draw only as many distinct spots as there are enemies, in one call
+            enemy_total = sum(count for _, count in config.enemies)
+            enemy_candidates = rng.sample(enemy_candidates, min(enemy_total, len(enemy_candidates)))
         else:
             enemy_candidates = []
         
@@ -192,15 +220,16 @@ class GameEngine:
                     ex, ey = enemy_candidates[enemy_index]
                 else:
                     # Fallback positions
-                    ex = random.randint(3, self.grid.width - 4)
-                    ey = random.randint(3, self.grid.height - 4)
+                    ex = rng.randint(3, self.grid.width - 4)
+                    ey = rng.randint(3, self.grid.height - 4)
                 
                 enemy = Enemy(ex, ey, enemy_type=enemy_type)
                 self.enemies.append(enemy)
                 enemy_index += 1
+        self.enemy_index.rebuild(self.enemies)
         
         # Reset shadows
-        self.shadows = []
+        self.shadows = EntityList()
         
         # Reset timers
         self.enemy_timer = 0.0
@@ -212,15 +241,11 @@ class GameEngine:
     def _perform_initial_scan(self) -> None:
         """Reveal tiles around player starting position."""
         if self.player and self.grid:
-            revealed = self.pathfinding.bfs_scan(
-                (self.player.x, self.player.y), 
+            self.pathfinding.reveal_scan(
+                (self.player.ix, self.player.iy), 
                 self.grid, 
                 radius=5
             )
-            for rx, ry in revealed:
-                tile = self.grid.get_tile(rx, ry)
-                if tile:
-                    tile.visible = True
     
     def handle_events(self) -> bool:
         """
@@ -259,17 +284,30 @@ class GameEngine:
         logger.info("Starting game loop")
         running = True
         
+        # Bind per-frame lookups to locals once
+        tick = self.clock.tick
+        fps = FPS
+        handle_events = self.handle_events
+        update = self.update
+        render = self.render
+        
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            self.sim_lag += tick(fps) / 1000.0
             
             # Handle events
-            running = self.handle_events()
+            running = handle_events()
             
-            # Update
-            self.update(dt)
+            # Update in fixed steps, independent of the render rate
+            steps = 0
+            while self.sim_lag >= SIM_STEP and steps < MAX_SIM_STEPS:
+                update(SIM_STEP)
+                self.sim_lag -= SIM_STEP
+                steps += 1
+            if steps == MAX_SIM_STEPS:
+                self.sim_lag = min(self.sim_lag, SIM_STEP)
             
             # Render
-            self.render()
+            render()
         
         logger.info("Game loop ended")
         pygame.quit()
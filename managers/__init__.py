@@ -1,3 +1,4 @@
 """Managers package for Solo Leveling game."""
 from .asset_manager import AssetManager
 from .sound_manager import SoundManager
+from .font_cache import get_font, get_text_surface
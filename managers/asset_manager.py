@@ -3,13 +3,18 @@ Asset manager for loading and managing game assets.
 """
 import pygame
 import sys
-from config.settings import TILE_WIDTH, TILE_HEIGHT
+from config.settings import TILE_WIDTH, TILE_HEIGHT, CAMERA_ZOOM
 
 class AssetManager:
     """Manages loading and storage of game assets (images)."""
     
     def __init__(self):
         self.images = {}
+        # Scaled copies, keyed by (asset key, zoom) or (asset key, size);
+        # see get_scaled and get_resized
+        self._scaled = {}
+        # Damage-flash silhouettes of scaled images, see get_flash
+        self._flash = {}
         try:
             # Try to load with new asset names first, fall back to iso_ prefix if not found
             asset_files = {
@@ -56,3 +61,62 @@ class AssetManager:
             print(f"ERROR LOADING ASSETS: {e}")
             print("Make sure you have the 'assets' folder with image files.")
             sys.exit()
+    
+    def get_scaled(self, key, zoom=CAMERA_ZOOM):
+        """
+        Image key scaled by zoom, built on first request and cached.
+        Returns None if the image is not loaded or scales to nothing.
+        """
+        cache_key = (key, zoom)
+        if cache_key not in self._scaled:
+            self._scaled[cache_key] = self._scale(self.images.get(key), zoom)
+        return self._scaled[cache_key]
+    
+    def get_resized(self, key, size):
+        """
+        Image key scaled to an exact (width, height), e.g. for menu icons.
+        Cached alongside get_scaled; returns None if the image is not loaded.
+        """
+        cache_key = (key, size)
+        if cache_key not in self._scaled:
+            image = self.images.get(key)
+            if image is not None:
+                image = pygame.transform.scale(image, size).convert_alpha()
+            self._scaled[cache_key] = image
+        return self._scaled[cache_key]
+    
+    def get_flash(self, key, zoom=CAMERA_ZOOM):
+        """
+        Damage-flash version of get_scaled(key, zoom), cached the same way.
+        Returns None if there is no scaled image.
+        """
+        cache_key = (key, zoom)
+        if cache_key not in self._flash:
+            scaled = self.get_scaled(key, zoom)
+            flash = None
+            if scaled:
+                flash = scaled.copy()
+                flash.fill((255, 255, 255, 200), special_flags=pygame.BLEND_RGBA_MULT)
+            self._flash[cache_key] = flash
+        return self._flash[cache_key]
+    
+    def get_scaled_fog(self, zoom=CAMERA_ZOOM):
+        """Fog texture scaled by zoom, cached like get_scaled."""
+        cache_key = ('fog', zoom)
+        if cache_key not in self._scaled:
+            self._scaled[cache_key] = self._scale(self.fog_surf, zoom)
+        return self._scaled[cache_key]
+    
+    @staticmethod
+    def _scale(surface, zoom):
+        """
+        Scaled copy of surface in the display's pixel format, or None if there
+        is nothing to draw.
+        """
+        if surface is None:
+            return None
+        width = int(surface.get_width() * zoom)
+        height = int(surface.get_height() * zoom)
+        if width <= 0 or height <= 0:
+            return None
+        return pygame.transform.scale(surface, (width, height)).convert_alpha()
@@ -0,0 +1,40 @@
+"""
+Font cache for sharing pygame fonts and static text surfaces.
+Each font is looked up once per (name, size, bold) and reused across levels.
+"""
+from functools import lru_cache
+
+import pygame
+
+
+@lru_cache(maxsize=None)
+def get_font(name, size, bold=False):
+    """
+    Get the font for (name, size, bold), creating it on first request.
+    A name of None selects pygame's default font, anything else a system font.
+    """
+    if name is None:
+        font = pygame.font.Font(None, size)
+        font.set_bold(bold)
+        return font
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+@lru_cache(maxsize=256)
+def get_text_surface(font, text, color, antialias=True):
+    """
+    Rendered surface for text that does not change between frames.
+    The surface is shared, so callers must only blit it, never draw on it.
+    """
+    return font.render(text, antialias, color)
+
+
+@lru_cache(maxsize=64)
+def get_faded_text_surface(font, text, color, alpha, antialias=True):
+    """
+    Copy of get_text_surface(font, text, color) with surface alpha set,
+    e.g. for glow layers. Shared like get_text_surface: blit only.
+    """
+    surface = get_text_surface(font, text, color, antialias).copy()
+    surface.set_alpha(alpha)
+    return surface
@@ -20,15 +20,36 @@ class Camera:
         iso_y = (gx + gy) * (TILE_HEIGHT // 2) * CAMERA_ZOOM
         return iso_x, iso_y
     
-    def update(self, player, screen_width, screen_height):
-        """Update camera position to follow player smoothly."""
+    def cells_to_iso(self, cells, offset_x=0, offset_y=0):
+        """
+        cart_to_iso for a sequence of (gx, gy) cells, shifted by an offset.
+        Returns a list of (x, y) points, e.g. screen positions for a path.
+        """
+        step_x = (TILE_WIDTH // 2) * CAMERA_ZOOM
+        step_y = (TILE_HEIGHT // 2) * CAMERA_ZOOM
+        return [
+            ((gx - gy) * step_x + offset_x, (gx + gy) * step_y + offset_y)
+            for gx, gy in cells
+        ]
+    
+    def iso_to_cart(self, iso_x, iso_y):
+        """Convert isometric world coordinates back to (fractional) grid coordinates."""
+        u = iso_x / ((TILE_WIDTH // 2) * CAMERA_ZOOM)   # gx - gy
+        v = iso_y / ((TILE_HEIGHT // 2) * CAMERA_ZOOM)  # gx + gy
+        return (u + v) / 2, (v - u) / 2
+    
+    def update(self, player, screen_width, screen_height, lookahead=0.0):
+        """
+        Update camera position to follow player smoothly.
+        lookahead is the time since the last simulation step (see Player.visual_progress).
+        """
         world_offset = (screen_width // 2, screen_height // 3)
         
         # Calculate player's isometric position (with interpolation if moving)
         if player.moving:
             sx0, sy0 = self.cart_to_iso(*player.move_start)
             sx1, sy1 = self.cart_to_iso(*player.move_target)
-            lerp = max(0.0, min(1.0, player.move_progress))
+            lerp = player.visual_progress(lookahead)
             player_iso_x = sx0 + (sx1 - sx0) * lerp
             player_iso_y = sy0 + (sy1 - sy0) * lerp
         else:
@@ -1,9 +1,23 @@
 """
 Main isometric renderer for the game.
 """
+import math
 import pygame
 from config.settings import TILE_WIDTH, TILE_HEIGHT, ELEVATION_OFFSET, CAMERA_ZOOM, RESPONSIVE_SCALE
 from config.constants import RED, GREEN, WHITE, CYAN
+from managers.font_cache import get_font, get_text_surface
+
+# Zoomed sizes in screen pixels, fixed for the whole run
+ELEVATION_PX = int(ELEVATION_OFFSET * CAMERA_ZOOM)
+HALF_TILE_W = int(TILE_WIDTH * CAMERA_ZOOM / 2)
+HALF_TILE_H = int(TILE_HEIGHT * CAMERA_ZOOM / 2)
+
+# Patrol overlays kept before the cache is reset (a few routes per level)
+PATROL_CACHE_MAX_ROUTES = 64
+
+# Distance from an enemy's tile anchor that its state label, path nodes and
+# arrow head can reach, on top of the detection radius or path length
+ENEMY_OVERLAY_MARGIN_PX = 128
 
 class Renderer:
     """Handles all isometric rendering for the game."""
@@ -11,7 +25,7 @@ class Renderer:
     def __init__(self, assets):
         self.assets = assets
         self.hover_tile: tuple[int, int] | None = None
-        self.preview_path: list[tuple[int, int]] = []  # Path preview tiles
+        self.preview_path: set[tuple[int, int]] = set()  # Path preview tiles
         
         # BFS Animation state
         self.bfs_layers: list[list[tuple[int, int]]] = []  # Tiles grouped by BFS distance
@@ -20,6 +34,28 @@ class Renderer:
         self.bfs_layer_delay: float = 0.15  # Seconds between each layer reveal
         self.bfs_active: bool = False
         self.bfs_revealed_tiles: set[tuple[int, int]] = set()  # Track revealed for glow effect
+        
+        # Isometric coordinates of every tile, see _iso_table
+        self._iso_cache: list[tuple[float, float]] = []
+        self._iso_cache_key: tuple[int, int] | None = None
+        
+        # Floor and fog composited into single surfaces, see _floor_layer/_fog_layer
+        self._floor_layer_cache: tuple[pygame.Surface, float, float] | None = None
+        self._floor_layer_key: tuple[int, int] | None = None
+        self._fog_layer_cache: tuple[pygame.Surface, float, float] | None = None
+        self._fog_layer_key: tuple[int, int] | None = None
+        self._fog_layer_visible: bytearray | None = None  # visible_map the fog was built for
+        
+        # Highlight diamonds by style, see _diamond_overlay
+        self._diamond_cache: dict[tuple, pygame.Surface] = {}
+        # Filled detection circles by radius in pixels
+        self._radius_cache: dict[int, pygame.Surface] = {}
+        # Path node markers by (color, size), see _path_node
+        self._node_cache: dict[tuple, pygame.Surface] = {}
+        # Patrol route overlays by route, see _patrol_overlay
+        self._patrol_cache: dict[tuple, tuple[pygame.Surface, int, int]] = {}
+        # Health bars by (filled width, color), see _health_bar_blit
+        self._bar_cache: dict[tuple, pygame.Surface] = {}
     
     def start_bfs_animation(self, layers: list[list[tuple[int, int]]]) -> None:
         """Start BFS wave animation with given layers."""
@@ -39,12 +75,14 @@ class Renderer:
         # Reveal layers based on time
         while (self.bfs_current_layer < len(self.bfs_layers) and 
                self.bfs_animation_timer >= self.bfs_layer_delay * self.bfs_current_layer):
-            # Reveal this layer's tiles
-            for (tx, ty) in self.bfs_layers[self.bfs_current_layer]:
-                tile = grid.get_tile(tx, ty)
-                if tile:
-                    tile.visible = True
-                self.bfs_revealed_tiles.add((tx, ty))
+            # Reveal this layer's tiles straight in the visibility map
+            # (layers from bfs_scan_layered are always in bounds)
+            layer = self.bfs_layers[self.bfs_current_layer]
+            visible_map = grid.visible_map
+            height = grid.height
+            for (tx, ty) in layer:
+                visible_map[tx * height + ty] = 1
+            self.bfs_revealed_tiles.update(layer)
             self.bfs_current_layer += 1
         
         # Animation complete
@@ -54,88 +92,221 @@ class Renderer:
                 self.bfs_active = False
                 self.bfs_revealed_tiles.clear()
     
-    def render_game(self, screen, grid, player, enemies, shadows, camera, screen_width, screen_height):
-        """Render the main game viewport."""
+    def render_game(self, screen, grid, player, enemies, shadows, camera, screen_width, screen_height,
+                    lookahead=0.0):
+        """
+        Render the main game viewport.
+        lookahead is the time since the last simulation step, used to
+        interpolate the player between fixed updates.
+        """
         world_offset = camera.get_world_offset(screen_width, screen_height)
-        
-        # Render tiles
-        for y in range(grid.height):
-            for x in range(grid.width):
-                tile = grid.get_tile(x, y)
-                iso_x, iso_y = camera.cart_to_iso(x, y)
-                sx = iso_x + world_offset[0] + camera.x
-                sy = iso_y + world_offset[1] + camera.y
-                
-                # Draw floor
-                self._render_floor(screen, sx, sy)
-                
-                # Draw objects if visible
-                if tile.visible:
-                    self._render_tile_object(screen, tile, sx, sy)
-                    
-                # Draw entities
-                if tile.visible:
-                    # Draw player
-                    if int(round(player.x)) == x and int(round(player.y)) == y:
-                        self._render_player(screen, player, camera, world_offset, sx, sy)
-                    
-                    # Draw enemies
-                    for enemy in enemies:
-                        if enemy.x == x and enemy.y == y:
-                            self._render_enemy(screen, enemy, sx, sy)
-                    
-                    # Draw shadows
-                    for shadow in shadows:
-                        if shadow.x == x and shadow.y == y:
-                            self._render_shadow(screen, shadow, sx, sy)
-                
-                # Fog of war
-                if not tile.visible:
-                    self._render_fog(screen, sx, sy)
+        ox = world_offset[0] + camera.x
+        oy = world_offset[1] + camera.y
+        iso_table = self._iso_table(grid, camera)
+        
+        # Floors lie under everything else and never change, so they are
+        # drawn from a pre-rendered layer in one blit
+        floor_layer = self._floor_layer(grid, iso_table)
+        if floor_layer:
+            layer, left, top = floor_layer
+            screen.blit(layer, (left + ox, top + oy))
+        
+        # Fog only covers unrevealed tiles, where nothing else is drawn, so it
+        # can go down before the objects too; it is rebuilt when tiles are revealed
+        fog_layer = self._fog_layer(grid, iso_table)
+        if fog_layer:
+            layer, left, top = fog_layer
+            screen.blit(layer, (left + ox, top + oy))
+        
+        # The grid range is a box around the screen's diamond in grid space;
+        # its corner tiles still need a per-tile check against the screen
+        tile_positions = []
+        height = grid.height
+        anchor_area = self._tile_anchor_area(screen_width, screen_height)
+        min_sx, max_sx, min_sy, max_sy = anchor_area
+        x0, x1, y0, y1 = self._visible_tile_bounds(grid, camera, ox, oy, anchor_area)
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                iso_x, iso_y = iso_table[x * height + y]
+                sx = iso_x + ox
+                sy = iso_y + oy
+                if min_sx <= sx <= max_sx and min_sy <= sy <= max_sy:
+                    tile_positions.append((x, y, sx, sy))
+        
+        # Index entities by tile once instead of scanning the lists per tile
+        enemies_at = {}
+        for enemy in enemies:
+            enemies_at.setdefault((enemy.x, enemy.y), []).append(enemy)
+        shadows_at = {}
+        for shadow in shadows:
+            shadows_at.setdefault((shadow.x, shadow.y), []).append(shadow)
+        player_tile = (player.ix, player.iy)
+        
+        # Everything on the tiles (objects, entities with their health bars,
+        # overlays) is queued in painter order and drawn in one call, so tall
+        # sprites still overlap the tiles behind them.
+        tile_blits = []
+        hover_surf = self._diamond_overlay((255, 255, 0, 60), (255, 255, 0, 200), 3)
+        preview_surf = self._diamond_overlay((0, 200, 255, 40), (0, 200, 255, 150), 2)
+        glow_surf = self._diamond_overlay((0, 255, 255, 80), (0, 255, 255, 200), 3)  # Cyan BFS glow
+        for x, y, sx, sy in tile_positions:
+            tile = grid.get_tile(x, y)
+            
+            if tile.visible:
+                # Draw objects
+                object_blit = self._tile_object_blit(tile, sx, sy)
+                if object_blit:
+                    tile_blits.append(object_blit)
                 
-                # Hover highlight
-                if self.hover_tile and self.hover_tile == (x, y):
-                    self._render_hover_highlight(screen, sx, sy)
+                # Draw player
+                if player_tile == (x, y):
+                    self._queue_player(tile_blits, player, camera, world_offset, sx, sy, lookahead)
                 
-                # Path preview
-                if (x, y) in self.preview_path:
-                    self._render_path_preview(screen, sx, sy)
+                # Draw enemies
+                for enemy in enemies_at.get((x, y), ()):
+                    self._queue_entity(tile_blits, enemy, sx, sy, RED)
                 
-                # BFS wave glow effect
-                if (x, y) in self.bfs_revealed_tiles:
-                    self._render_bfs_glow(screen, sx, sy)
+                # Draw shadows
+                for shadow in shadows_at.get((x, y), ()):
+                    self._queue_entity(tile_blits, shadow, sx, sy, GREEN)
+            
+            # Hover highlight
+            if self.hover_tile == (x, y):
+                tile_blits.append((hover_surf, (sx, sy)))
+            
+            # Path preview
+            if (x, y) in self.preview_path:
+                tile_blits.append((preview_surf, (sx, sy)))
+            
+            # BFS wave glow effect
+            if (x, y) in self.bfs_revealed_tiles:
+                tile_blits.append((glow_surf, (sx, sy)))
+        screen.blits(tile_blits, doreturn=False)
         
         # Render enemy paths (debug visualization)
-        self._render_enemy_paths(screen, enemies, camera, world_offset)
+        self._render_enemy_paths(screen, enemies, camera, iso_table, height, ox, oy)
         
         # Render BFS wave label if active
         if self.bfs_active:
             self._render_bfs_label(screen, screen_width)
     
-    def _render_bfs_glow(self, screen, sx, sy):
-        """Render cyan glow for BFS revealed tiles."""
-        half_w = int(TILE_WIDTH * CAMERA_ZOOM / 2)
-        half_h = int(TILE_HEIGHT * CAMERA_ZOOM / 2)
-        center_x = sx + half_w
-        center_y = sy + half_h
-        
-        # Draw glowing diamond
-        glow_surf = pygame.Surface((half_w * 2, half_h * 2), pygame.SRCALPHA)
-        local_points = [
-            (half_w, 0),
-            (half_w * 2, half_h),
-            (half_w, half_h * 2),
-            (0, half_h),
+    def _iso_table(self, grid, camera):
+        """
+        Isometric coordinates of every tile, indexed x * height + y.
+        Built once per grid size; only the camera offset changes per frame.
+        """
+        key = (grid.width, grid.height)
+        if key != self._iso_cache_key:
+            self._iso_cache = [
+                camera.cart_to_iso(x, y) for x in range(grid.width) for y in range(grid.height)
+            ]
+            self._iso_cache_key = key
+        return self._iso_cache
+    
+    def _floor_layer(self, grid, iso_table):
+        """
+        Every floor tile composited into one surface, see _compose_layer.
+        Rebuilt when the grid size changes.
+        """
+        key = (grid.width, grid.height)
+        if key != self._floor_layer_key:
+            self._floor_layer_key = key
+            height = grid.height
+            positions = [iso_table[x * height + y] for y in range(height) for x in range(grid.width)]
+            self._floor_layer_cache = self._compose_layer(self.assets.get_scaled('floor'), positions)
+        return self._floor_layer_cache
+    
+    def _fog_layer(self, grid, iso_table):
+        """
+        Fog over every unrevealed tile composited into one surface, see
+        _compose_layer. Rebuilt when the grid size or any tile's visibility changes.
+        """
+        key = (grid.width, grid.height)
+        if key != self._fog_layer_key or grid.visible_map != self._fog_layer_visible:
+            self._fog_layer_key = key
+            self._fog_layer_visible = bytearray(grid.visible_map)
+            height = grid.height
+            visible_map = grid.visible_map
+            positions = [
+                iso_table[x * height + y]
+                for y in range(height) for x in range(grid.width)
+                if not visible_map[x * height + y]
+            ]
+            self._fog_layer_cache = self._compose_layer(self.assets.get_scaled_fog(), positions)
+        return self._fog_layer_cache
+    
+    @staticmethod
+    def _compose_layer(image, positions):
+        """
+        Surface with image drawn at each isometric position in order, plus the
+        isometric position of the surface's top-left corner.
+        Returns None if there is no image or no position.
+        """
+        if not image or not positions:
+            return None
+        left = min(ix for ix, _ in positions)
+        top = min(iy for _, iy in positions)
+        width = math.ceil(max(ix for ix, _ in positions) - left) + image.get_width()
+        height = math.ceil(max(iy for _, iy in positions) - top) + image.get_height()
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        layer.blits([(image, (ix - left, iy - top)) for ix, iy in positions], doreturn=False)
+        return (layer.convert_alpha(), left, top)
+    
+    @staticmethod
+    def _tile_anchor_area(screen_width, screen_height):
+        """
+        Screen range (min_sx, max_sx, min_sy, max_sy) of tile anchors (sx, sy)
+        whose tile can still draw something on screen. Widened by a tile so
+        sprites, health bars and the interpolated player are kept.
+        """
+        tile_w = TILE_WIDTH * CAMERA_ZOOM
+        tile_h = TILE_HEIGHT * CAMERA_ZOOM
+        elev = ELEVATION_OFFSET * CAMERA_ZOOM
+        return (-2 * tile_w, screen_width + tile_w, -3 * tile_h, screen_height + elev + tile_h)
+    
+    def _visible_tile_bounds(self, grid, camera, ox, oy, anchor_area):
+        """
+        Grid range (x0, x1, y0, y1), end-exclusive, covering every tile whose
+        anchor falls in anchor_area. Found by projecting the area's corners
+        back to grid space.
+        """
+        min_sx, max_sx, min_sy, max_sy = anchor_area
+        corners = [
+            camera.iso_to_cart(sx - ox, sy - oy)
+            for sx in (min_sx, max_sx) for sy in (min_sy, max_sy)
         ]
-        pygame.draw.polygon(glow_surf, (0, 255, 255, 80), local_points)  # Cyan fill
-        pygame.draw.polygon(glow_surf, (0, 255, 255, 200), local_points, 3)  # Bright border
-        screen.blit(glow_surf, (center_x - half_w, center_y - half_h))
+        x0 = max(0, math.floor(min(gx for gx, _ in corners)))
+        x1 = min(grid.width, math.ceil(max(gx for gx, _ in corners)) + 1)
+        y0 = max(0, math.floor(min(gy for _, gy in corners)))
+        y1 = min(grid.height, math.ceil(max(gy for _, gy in corners)) + 1)
+        return x0, x1, y0, y1
+    
+    def _diamond_overlay(self, fill_color, border_color, border_width):
+        """
+        Translucent tile-sized diamond, drawn once per style and cached.
+        Blit it at a tile's screen position to highlight that tile.
+        """
+        key = (fill_color, border_color, border_width)
+        surf = self._diamond_cache.get(key)
+        if surf is None:
+            half_w, half_h = HALF_TILE_W, HALF_TILE_H
+            surf = pygame.Surface((half_w * 2, half_h * 2), pygame.SRCALPHA)
+            local_points = [
+                (half_w, 0),
+                (half_w * 2, half_h),
+                (half_w, half_h * 2),
+                (0, half_h),
+            ]
+            pygame.draw.polygon(surf, fill_color, local_points)
+            pygame.draw.polygon(surf, border_color, local_points, border_width)
+            surf = self._diamond_cache[key] = surf.convert_alpha()
+        return surf
     
     def _render_bfs_label(self, screen, screen_width):
         """Render BFS algorithm label during animation."""
-        font = pygame.font.Font(None, 36)
+        font = get_font(None, 36)
         layer_text = f"BFS SCAN - Layer {self.bfs_current_layer}/{len(self.bfs_layers)}"
-        text_surf = font.render(layer_text, True, (0, 255, 255))
+        text_surf = get_text_surface(font, layer_text, (0, 255, 255))
         text_rect = text_surf.get_rect(center=(screen_width // 2, 50))
         
         # Background
@@ -144,24 +315,41 @@ class Renderer:
         pygame.draw.rect(screen, (0, 200, 200), bg_rect, 2, border_radius=5)
         screen.blit(text_surf, text_rect)
     
-    def _render_enemy_paths(self, screen, enemies, camera, world_offset):
+    def _render_enemy_paths(self, screen, enemies, camera, iso_table, height, ox, oy):
         """
         Render A* path lines for all enemies.
         Showcases A* pathfinding algorithm visualization for AI course.
+        Cells are projected through iso_table (see _iso_table) plus the
+        screen offset (ox, oy). Overlays that cannot reach the screen are
+        skipped before any drawing work.
         """
+        screen_w, screen_h = screen.get_size()
+        step_w = TILE_WIDTH * CAMERA_ZOOM / 2
+        step_h = TILE_HEIGHT * CAMERA_ZOOM / 2
         for enemy in enemies:
-            # Draw detection radius (territory visualization)
-            self._render_detection_radius(screen, enemy, camera, world_offset)
+            iso_x, iso_y = iso_table[enemy.x * height + enemy.y]
+            sx = iso_x + ox
+            sy = iso_y + oy
             
-            # Draw state indicator above enemy
-            self._render_enemy_state(screen, enemy, camera, world_offset)
+            margin = self._detection_radius_px(enemy) + ENEMY_OVERLAY_MARGIN_PX
+            if self._near_screen(sx, sy, margin, margin, screen_w, screen_h):
+                # Draw detection radius (territory visualization)
+                self._render_detection_radius(screen, enemy, sx, sy)
+                
+                # Draw state indicator above enemy
+                self._render_enemy_state(screen, enemy, sx, sy)
             
             # Draw patrol route (always visible as dashed green)
-            self._render_patrol_route(screen, enemy, camera, world_offset)
+            self._render_patrol_route(screen, enemy, camera, ox, oy)
             
-            # Draw current path (A* path to target)
+            # Draw current path (A* path to target); each step moves one
+            # tile, so the path stays within len(path) steps of the enemy
             if not enemy.path:
                 continue
+            steps = len(enemy.path)
+            if not self._near_screen(sx, sy, steps * step_w + ENEMY_OVERLAY_MARGIN_PX,
+                                     steps * step_h + ENEMY_OVERLAY_MARGIN_PX, screen_w, screen_h):
+                continue
                 
             # Path color based on state: Red for hunting, Yellow for patrol
             if enemy.state == "HUNTING":
@@ -173,40 +361,56 @@ class Renderer:
                 node_color = (255, 220, 100)
                 line_width = 2
             
-            # Start from enemy current position
-            start_iso = camera.cart_to_iso(enemy.x, enemy.y)
-            start_pt = (
-                start_iso[0] + world_offset[0] + camera.x + 32,
-                start_iso[1] + world_offset[1] + camera.y + 16
-            )
-            
-            points = [start_pt]
-            
-            for (nx, ny) in enemy.path:
-                iso = camera.cart_to_iso(nx, ny)
-                pt = (
-                    iso[0] + world_offset[0] + camera.x + 32,
-                    iso[1] + world_offset[1] + camera.y + 16
-                )
-                points.append(pt)
+            # Start from enemy current position; whole pixels, converted once
+            points = [(int(sx + 32), int(sy + 16))]
+            for nx, ny in enemy.path:
+                iso_x, iso_y = iso_table[nx * height + ny]
+                points.append((int(iso_x + ox + 32), int(iso_y + oy + 16)))
             
             # Draw path lines (thicker for hunting)
             if len(points) > 1:
                 pygame.draw.lines(screen, path_color, False, points, line_width)
                 
                 # Draw nodes along path
-                for i, pt in enumerate(points):
-                    node_size = 6 if i == len(points) - 1 else 4  # Larger target node
-                    pygame.draw.circle(screen, node_color, (int(pt[0]), int(pt[1])), node_size)
-                    pygame.draw.circle(screen, (0, 0, 0), (int(pt[0]), int(pt[1])), node_size, 1)
+                node = self._path_node(node_color, 4)
+                target_node = self._path_node(node_color, 6)  # Larger target node
+                node_blits = [(node, (px - 4, py - 4)) for px, py in points[:-1]]
+                tx, ty = points[-1]
+                node_blits.append((target_node, (tx - 6, ty - 6)))
+                screen.blits(node_blits, doreturn=False)
                 
                 # Draw arrow head at end to show direction
                 if len(points) >= 2:
                     self._draw_arrow_head(screen, points[-2], points[-1], path_color)
     
-    def _render_detection_radius(self, screen, enemy, camera, world_offset):
+    def _path_node(self, color, size):
         """
-        Render enemy detection radius as a circle.
+        Path node marker (filled circle with a black outline), cached per
+        (color, size). Blit it at the node position minus size.
+        """
+        key = (color, size)
+        surf = self._node_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (size, size), size)
+            pygame.draw.circle(surf, (0, 0, 0), (size, size), size, 1)
+            surf = self._node_cache[key] = surf.convert_alpha()
+        return surf
+    
+    @staticmethod
+    def _near_screen(sx, sy, margin_x, margin_y, screen_w, screen_h):
+        """True if (sx, sy) lies on the screen widened by the given margins."""
+        return (-margin_x <= sx <= screen_w + margin_x
+                and -margin_y <= sy <= screen_h + margin_y)
+    
+    @staticmethod
+    def _detection_radius_px(enemy):
+        """Enemy detection radius in screen pixels (approximate)."""
+        return int(enemy.detection_range * TILE_WIDTH * CAMERA_ZOOM / 4)
+    
+    def _render_detection_radius(self, screen, enemy, sx, sy):
+        """
+        Render enemy detection radius as a circle around the enemy's tile at (sx, sy).
         Only shows when player has entered territory (HUNTING state).
         """
         # Only show radius when enemy is actively hunting
@@ -214,34 +418,33 @@ class Renderer:
             return
             
         # Get center position
-        iso = camera.cart_to_iso(enemy.x, enemy.y)
-        center_x = iso[0] + world_offset[0] + camera.x + 32
-        center_y = iso[1] + world_offset[1] + camera.y + 16
+        center_x = sx + 32
+        center_y = sy + 16
         
-        # Calculate radius in screen pixels (approximate)
-        detection_range = getattr(enemy, 'detection_range', 8)
-        radius_px = int(detection_range * TILE_WIDTH * CAMERA_ZOOM / 4)
+        radius_px = self._detection_radius_px(enemy)
         
         # Red color for hunting state
         color = (255, 50, 50, 60)
         border_color = (255, 50, 50)
         
-        # Create transparent surface for filled circle
-        radius_surf = pygame.Surface((radius_px * 2, radius_px * 2), pygame.SRCALPHA)
-        pygame.draw.circle(radius_surf, color, (radius_px, radius_px), radius_px)
+        # Transparent filled circle, shared by every enemy with this radius
+        radius_surf = self._radius_cache.get(radius_px)
+        if radius_surf is None:
+            radius_surf = pygame.Surface((radius_px * 2, radius_px * 2), pygame.SRCALPHA)
+            pygame.draw.circle(radius_surf, color, (radius_px, radius_px), radius_px)
+            radius_surf = self._radius_cache[radius_px] = radius_surf.convert_alpha()
         screen.blit(radius_surf, (center_x - radius_px, center_y - radius_px))
         
         # Draw border
         pygame.draw.circle(screen, border_color, (int(center_x), int(center_y)), radius_px, 2)
     
-    def _render_enemy_state(self, screen, enemy, camera, world_offset):
-        """Render enemy state text above enemy."""
-        iso = camera.cart_to_iso(enemy.x, enemy.y)
-        x = iso[0] + world_offset[0] + camera.x + 16
-        y = iso[1] + world_offset[1] + camera.y - int(ELEVATION_OFFSET * CAMERA_ZOOM) - 30
+    def _render_enemy_state(self, screen, enemy, sx, sy):
+        """Render enemy state text above the enemy's tile at (sx, sy)."""
+        x = sx + 16
+        y = sy - ELEVATION_PX - 30
         
         # State text and color
-        state = getattr(enemy, 'state', 'IDLE')
+        state = enemy.state
         if state == "HUNTING":
             color = (255, 80, 80)
             text = "HUNTING (A*)"
@@ -252,8 +455,7 @@ class Renderer:
             color = (150, 150, 150)
             text = "IDLE"
         
-        font = pygame.font.Font(None, 20)
-        text_surf = font.render(text, True, color)
+        text_surf = get_text_surface(get_font(None, 20), text, color)
         text_rect = text_surf.get_rect(center=(x + 16, y))
         
         # Background for readability
@@ -261,53 +463,74 @@ class Renderer:
         pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
         screen.blit(text_surf, text_rect)
     
-    def _render_patrol_route(self, screen, enemy, camera, world_offset):
+    def _render_patrol_route(self, screen, enemy, camera, ox, oy):
         """
         Render enemy patrol route as green dashed lines.
         Shows the AI patrol behavior pattern.
         """
-        patrol_points = getattr(enemy, 'patrol_points', [])
+        patrol_points = enemy.patrol_points
         if len(patrol_points) < 2:
             return
         
+        # Routes rarely change, so the whole overlay is drawn once and cached
+        overlay, left, top = self._patrol_overlay(camera, patrol_points)
+        dest = (left + ox, top + oy)
+        if overlay.get_rect(topleft=dest).colliderect(screen.get_rect()):
+            screen.blit(overlay, dest)
+    
+    def _patrol_overlay(self, camera, patrol_points):
+        """
+        Surface with the dashed patrol loop and numbered waypoint markers,
+        plus the isometric position of its top-left corner. Cached per route.
+        """
+        key = tuple(patrol_points)
+        cached = self._patrol_cache.get(key)
+        if cached is not None:
+            return cached
+        
         # Only show patrol route when not hunting (or always show as background info)
         patrol_color = (100, 200, 100)  # Green for patrol
         
-        # Convert patrol points to screen coordinates
-        screen_points = []
-        for (px, py) in patrol_points:
-            iso = camera.cart_to_iso(px, py)
-            pt = (
-                iso[0] + world_offset[0] + camera.x + 32,
-                iso[1] + world_offset[1] + camera.y + 16
-            )
-            screen_points.append(pt)
+        # Convert patrol points to isometric coordinates; they may lie outside
+        # the grid, so they are projected directly rather than via the tile table
+        points = camera.cells_to_iso(patrol_points, 32, 16)
+        pad = 10  # Room for the waypoint markers around the outermost points
+        left = math.floor(min(x for x, _ in points)) - pad
+        top = math.floor(min(y for _, y in points)) - pad
+        width = math.ceil(max(x for x, _ in points)) - left + pad
+        height = math.ceil(max(y for _, y in points)) - top + pad
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        local_points = [(x - left, y - top) for x, y in points]
         
         # Draw dashed lines between patrol points
-        for i in range(len(screen_points)):
-            start = screen_points[i]
-            end = screen_points[(i + 1) % len(screen_points)]  # Loop back to first
-            self._draw_dashed_line(screen, start, end, patrol_color, 2, 8)
+        for i in range(len(local_points)):
+            start = local_points[i]
+            end = local_points[(i + 1) % len(local_points)]  # Loop back to first
+            self._draw_dashed_line(overlay, start, end, patrol_color, 2, 8)
         
         # Draw patrol waypoint markers
-        for i, pt in enumerate(screen_points):
-            # Draw numbered circle marker
-            pygame.draw.circle(screen, patrol_color, (int(pt[0]), int(pt[1])), 8)
-            pygame.draw.circle(screen, (0, 0, 0), (int(pt[0]), int(pt[1])), 8, 1)
+        marker = self._path_node(patrol_color, 8)
+        font = get_font(None, 16)
+        for i, pt in enumerate(local_points):
+            px, py = int(pt[0]), int(pt[1])
+            # Numbered circle marker
+            overlay.blit(marker, (px - 8, py - 8))
             
-            # Draw waypoint number
-            font = pygame.font.Font(None, 16)
-            num_surf = font.render(str(i + 1), True, (0, 0, 0))
-            num_rect = num_surf.get_rect(center=(int(pt[0]), int(pt[1])))
-            screen.blit(num_surf, num_rect)
+            # Waypoint number
+            num_surf = get_text_surface(font, str(i + 1), (0, 0, 0))
+            overlay.blit(num_surf, num_surf.get_rect(center=(px, py)))
+        
+        if len(self._patrol_cache) >= PATROL_CACHE_MAX_ROUTES:
+            self._patrol_cache.clear()
+        cached = self._patrol_cache[key] = (overlay.convert_alpha(), left, top)
+        return cached
     
     def _draw_dashed_line(self, screen, start, end, color, width, dash_length):
         """Draw a dashed line between two points."""
-        import math
         dx = end[0] - start[0]
         dy = end[1] - start[1]
-        length = math.sqrt(dx*dx + dy*dy)
-        if length == 0:
+        length = math.hypot(dx, dy)
+        if not length:
             return
         
         dx, dy = dx/length, dy/length
@@ -340,11 +563,11 @@ class Renderer:
         screen.blit(panel_surf, (panel_x, panel_y))
         
         # Fonts
-        title_font = pygame.font.Font(None, 24)
-        body_font = pygame.font.Font(None, 18)
+        title_font = get_font(None, 24)
+        body_font = get_font(None, 18)
         
         # Title
-        title = title_font.render("AI ALGORITHM STATS", True, (0, 220, 255))
+        title = get_text_surface(title_font, "AI ALGORITHM STATS", (0, 220, 255))
         screen.blit(title, (panel_x + 10, panel_y + 8))
         
         # Separator
@@ -360,27 +583,34 @@ class Renderer:
         patrol_count = sum(1 for e in enemies if e.state == "PATROL")
         total_path_nodes = sum(len(e.path) for e in enemies)
         
-        # Stats lines
-        stats = [
+        # Count lines change with almost every enemy step, so they are
+        # rendered each frame rather than filling the shared text cache
+        counts = [
             (f"Enemies Tracking (A*): {hunting_count}", (255, 100, 100) if hunting_count > 0 else (150, 150, 150)),
             (f"Enemies Patrolling: {patrol_count}", (100, 200, 100)),
             (f"Total Path Nodes: {total_path_nodes}", (200, 200, 200)),
-            (f"Algorithm: A* Pathfinding", (0, 200, 200)),
-            (f"Heuristic: Manhattan Distance", (0, 200, 200)),
         ]
-        
-        for stat_text, color in stats:
+        for stat_text, color in counts:
             stat_surf = body_font.render(stat_text, True, color)
             screen.blit(stat_surf, (panel_x + 10, y))
             y += line_height
+        
+        # Fixed algorithm info lines come from the text cache
+        info = [
+            ("Algorithm: A* Pathfinding", (0, 200, 200)),
+            ("Heuristic: Manhattan Distance", (0, 200, 200)),
+        ]
+        for stat_text, color in info:
+            stat_surf = get_text_surface(body_font, stat_text, color)
+            screen.blit(stat_surf, (panel_x + 10, y))
+            y += line_height
     
     def _draw_arrow_head(self, screen, start, end, color):
         """Draw arrow head pointing from start to end."""
-        import math
         dx = end[0] - start[0]
         dy = end[1] - start[1]
-        length = math.sqrt(dx*dx + dy*dy)
-        if length == 0:
+        length = math.hypot(dx, dy)
+        if not length:
             return
         
         # Normalize
@@ -395,96 +625,40 @@ class Renderer:
         
         pygame.draw.polygon(screen, color, [end, left, right])
     
-    def _render_floor(self, screen, sx, sy):
-        """Render floor tile."""
-        floor_img = self.assets.images['floor']
-        floor_scaled_width = int(floor_img.get_width() * CAMERA_ZOOM)
-        floor_scaled_height = int(floor_img.get_height() * CAMERA_ZOOM)
-        if floor_scaled_width > 0 and floor_scaled_height > 0:
-            floor_scaled = pygame.transform.scale(floor_img, (floor_scaled_width, floor_scaled_height))
-            screen.blit(floor_scaled, (sx, sy))
-    
-    def _render_hover_highlight(self, screen, sx, sy):
-        """Render hover highlight on a tile."""
-        # Create isometric diamond shape
-        half_w = int(TILE_WIDTH * CAMERA_ZOOM / 2)
-        half_h = int(TILE_HEIGHT * CAMERA_ZOOM / 2)
-        center_x = sx + half_w
-        center_y = sy + half_h
-        
-        points = [
-            (center_x, center_y - half_h),  # Top
-            (center_x + half_w, center_y),   # Right
-            (center_x, center_y + half_h),   # Bottom
-            (center_x - half_w, center_y),   # Left
-        ]
-        
-        # Draw filled highlight with transparency
-        highlight_surf = pygame.Surface((half_w * 2, half_h * 2), pygame.SRCALPHA)
-        local_points = [
-            (half_w, 0),
-            (half_w * 2, half_h),
-            (half_w, half_h * 2),
-            (0, half_h),
-        ]
-        pygame.draw.polygon(highlight_surf, (255, 255, 0, 60), local_points)
-        pygame.draw.polygon(highlight_surf, (255, 255, 0, 200), local_points, 3)
-        screen.blit(highlight_surf, (center_x - half_w, center_y - half_h))
-    
-    def _render_path_preview(self, screen, sx, sy):
-        """Render path preview on a tile (cyan diamond)."""
-        half_w = int(TILE_WIDTH * CAMERA_ZOOM / 2)
-        half_h = int(TILE_HEIGHT * CAMERA_ZOOM / 2)
-        center_x = sx + half_w
-        center_y = sy + half_h
-        
-        # Draw filled highlight with transparency
-        highlight_surf = pygame.Surface((half_w * 2, half_h * 2), pygame.SRCALPHA)
-        local_points = [
-            (half_w, 0),
-            (half_w * 2, half_h),
-            (half_w, half_h * 2),
-            (0, half_h),
-        ]
-        pygame.draw.polygon(highlight_surf, (0, 200, 255, 40), local_points)
-        pygame.draw.polygon(highlight_surf, (0, 200, 255, 150), local_points, 2)
-        screen.blit(highlight_surf, (center_x - half_w, center_y - half_h))
-    
-    def _render_tile_object(self, screen, tile, sx, sy):
-        """Render tile objects (wall, trap, resource, exit)."""
-        img = None
+    def _tile_object_blit(self, tile, sx, sy):
+        """Blit entry for the tile's object (wall, trap, resource, exit), or None."""
+        img_key = None
         offset_y = 0
         
         if tile.type == 'wall':
-            img = self.assets.images['wall']
-            offset_y = int(ELEVATION_OFFSET * CAMERA_ZOOM)
+            img_key = 'wall'
+            offset_y = ELEVATION_PX
         elif tile.type == 'trap':
             trap_key = tile.trap_type if tile.trap_type else 'trap_spike'
             if trap_key in self.assets.images:
-                img = self.assets.images[trap_key]
+                img_key = trap_key
             else:
                  # Fallback if specific type not loaded
-                 img = self.assets.images.get('trap_spike')
+                 img_key = 'trap_spike'
         elif tile.type == 'resource':
-            img = self.assets.images['resource']
+            img_key = 'resource'
         elif tile.type == 'exit':
-            img = self.assets.images['exit']
-            offset_y = int(ELEVATION_OFFSET * CAMERA_ZOOM)
-        
-        if img:
-            # Scale image by zoom factor
-            scaled_width = int(img.get_width() * CAMERA_ZOOM)
-            scaled_height = int(img.get_height() * CAMERA_ZOOM)
-            if scaled_width > 0 and scaled_height > 0:
-                img_scaled = pygame.transform.scale(img, (scaled_width, scaled_height))
-                screen.blit(img_scaled, (sx, sy - offset_y))
+            img_key = 'exit'
+            offset_y = ELEVATION_PX
+        
+        if img_key:
+            # Image pre-scaled by zoom factor
+            img_scaled = self.assets.get_scaled(img_key)
+            if img_scaled:
+                return (img_scaled, (sx, sy - offset_y))
+        return None
     
-    def _render_player(self, screen, player, camera, world_offset, sx, sy):
-        """Render player with smooth interpolation."""
+    def _queue_player(self, blits, player, camera, world_offset, sx, sy, lookahead=0.0):
+        """Queue the player sprite and health bar with smooth interpolation."""
         if player.moving:
             psx0, psy0 = camera.cart_to_iso(*player.move_start)
             psx1, psy1 = camera.cart_to_iso(*player.move_target)
-            plerp = max(0.0, min(1.0, player.move_progress))
+            plerp = player.visual_progress(lookahead)
             p_iso_x = psx0 + (psx1 - psx0) * plerp
             p_iso_y = psy0 + (psy1 - psy0) * plerp
             p_sx = p_iso_x + world_offset[0] + camera.x
@@ -494,86 +668,55 @@ class Renderer:
             p_sy = sy
         
         if abs(p_sx - sx) < TILE_WIDTH and abs(p_sy - sy) < TILE_HEIGHT * 2:
-            player_img = self.assets.images['player']
-            p_scaled_width = int(player_img.get_width() * CAMERA_ZOOM)
-            p_scaled_height = int(player_img.get_height() * CAMERA_ZOOM)
+            player_scaled = self.assets.get_scaled('player')
             
-            if p_scaled_width > 0 and p_scaled_height > 0:
-                player_scaled = pygame.transform.scale(player_img, (p_scaled_width, p_scaled_height))
-                
+            if player_scaled:
                 # Damage flash check (Player doesn't have timer yet, skip for now or add if needed)
-                screen.blit(player_scaled, (p_sx, p_sy - int(ELEVATION_OFFSET * CAMERA_ZOOM)))
+                blits.append((player_scaled, (p_sx, p_sy - ELEVATION_PX)))
                 
-                # Draw Player Health Bar
-                self._render_health_bar(screen, p_sx, p_sy, player.health, player.max_health, p_scaled_width, GREEN)
+                # Player health bar
+                blits.append(self._health_bar_blit(
+                    p_sx, p_sy, player.health, player.max_health, player_scaled.get_width(), GREEN
+                ))
     
-    def _render_enemy(self, screen, enemy, sx, sy):
-        """Render enemy with health bar."""
-        enemy_asset_key = enemy.asset_key
-        if enemy_asset_key in self.assets.images:
-            enemy_img = self.assets.images[enemy_asset_key]
-            e_scaled_width = int(enemy_img.get_width() * CAMERA_ZOOM)
-            e_scaled_height = int(enemy_img.get_height() * CAMERA_ZOOM)
+    def _queue_entity(self, blits, entity, sx, sy, bar_color):
+        """Queue an enemy or shadow sprite (flashing when damaged) and its health bar."""
+        entity_scaled = self.assets.get_scaled(entity.asset_key)
+        if entity_scaled:
+            # Damage flash: white silhouette, built once per asset
+            if entity.damage_animation_timer > 0:
+                blits.append((self.assets.get_flash(entity.asset_key), (sx, sy - ELEVATION_PX)))
+            else:
+                blits.append((entity_scaled, (sx, sy - ELEVATION_PX)))
             
-            if e_scaled_width > 0 and e_scaled_height > 0:
-                enemy_scaled = pygame.transform.scale(enemy_img, (e_scaled_width, e_scaled_height))
-                
-                # Damage flash
-                if hasattr(enemy, 'damage_animation_timer') and enemy.damage_animation_timer > 0:
-                    # Create white silhouette
-                    flash_surf = enemy_scaled.copy()
-                    flash_surf.fill((255, 255, 255, 200), special_flags=pygame.BLEND_RGBA_MULT)
-                    screen.blit(flash_surf, (sx, sy - int(ELEVATION_OFFSET * CAMERA_ZOOM)))
-                else:
-                    screen.blit(enemy_scaled, (sx, sy - int(ELEVATION_OFFSET * CAMERA_ZOOM)))
-                
-                # Draw health bar
-                self._render_health_bar(screen, sx, sy, enemy.health, enemy.max_health, e_scaled_width, RED)
+            blits.append(self._health_bar_blit(
+                sx, sy, entity.health, entity.max_health, entity_scaled.get_width(), bar_color
+            ))
     
-    def _render_shadow(self, screen, shadow, sx, sy):
-        """Render shadow with health bar."""
-        shadow_asset_key = shadow.asset_key
-        if shadow_asset_key in self.assets.images:
-            shadow_img = self.assets.images[shadow_asset_key]
-            s_scaled_width = int(shadow_img.get_width() * CAMERA_ZOOM)
-            s_scaled_height = int(shadow_img.get_height() * CAMERA_ZOOM)
-            
-            if s_scaled_width > 0 and s_scaled_height > 0:
-                shadow_scaled = pygame.transform.scale(shadow_img, (s_scaled_width, s_scaled_height))
-                
-                # Damage flash
-                if hasattr(shadow, 'damage_animation_timer') and shadow.damage_animation_timer > 0:
-                    flash_surf = shadow_scaled.copy()
-                    flash_surf.fill((255, 255, 255, 200), special_flags=pygame.BLEND_RGBA_MULT)
-                    screen.blit(flash_surf, (sx, sy - int(ELEVATION_OFFSET * CAMERA_ZOOM)))
-                else:
-                    screen.blit(shadow_scaled, (sx, sy - int(ELEVATION_OFFSET * CAMERA_ZOOM)))
-                
-                # Draw health bar
-                self._render_health_bar(screen, sx, sy, shadow.health, shadow.max_health, s_scaled_width, GREEN)
-
-    def _render_health_bar(self, screen, sx, sy, current, max_hp, sprite_width, fill_color):
-        """Helper to render standardized health bar."""
+    def _health_bar_blit(self, sx, sy, current, max_hp, sprite_width, fill_color):
+        """
+        Blit entry for a standardized health bar centered above a sprite.
+        Bars are drawn once per (filled width, color) and cached.
+        """
         bar_width = 40
         bar_height = 6
         health_percent = max(0, min(1, current / max_hp))
+        fill_width = int(bar_width * health_percent)
+        
+        key = (fill_width, fill_color)
+        bar = self._bar_cache.get(key)
+        if bar is None:
+            bar = pygame.Surface((bar_width, bar_height)).convert()
+            # Background (Black)
+            bar.fill((0, 0, 0))
+            # Fill
+            if fill_width > 0:
+                bar.fill(fill_color, (0, 0, fill_width, bar_height))
+            # Border (White)
+            pygame.draw.rect(bar, WHITE, (0, 0, bar_width, bar_height), 1)
+            self._bar_cache[key] = bar
         
         # Centered above sprite
         bar_x = sx + sprite_width // 2 - bar_width // 2
-        bar_y = sy - int(ELEVATION_OFFSET * CAMERA_ZOOM) - 15
-        
-        # Background (Black)
-        pygame.draw.rect(screen, (0, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-        # Fill
-        if health_percent > 0:
-            pygame.draw.rect(screen, fill_color, (bar_x, bar_y, int(bar_width * health_percent), bar_height))
-        # Border (White)
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
-    
-    def _render_fog(self, screen, sx, sy):
-        """Render fog of war."""
-        fog_scaled_width = int(self.assets.fog_surf.get_width() * CAMERA_ZOOM)
-        fog_scaled_height = int(self.assets.fog_surf.get_height() * CAMERA_ZOOM)
-        if fog_scaled_width > 0 and fog_scaled_height > 0:
-            fog_scaled = pygame.transform.scale(self.assets.fog_surf, (fog_scaled_width, fog_scaled_height))
-            screen.blit(fog_scaled, (sx, sy))
+        bar_y = sy - ELEVATION_PX - 15
+        return (bar, (bar_x, bar_y))
@@ -8,6 +8,7 @@ import pygame
 from .base_state import BaseState
 from core.state_machine import StateType
 from core.logger import get_logger
+from managers.font_cache import get_font, get_text_surface
 
 if TYPE_CHECKING:
     from game_engine import GameEngine
@@ -42,16 +43,16 @@ class GameOverState(BaseState):
         """Render game over screen."""
         screen.fill((40, 20, 20))
         
-        font = pygame.font.Font(None, 72)
-        title = font.render("GAME OVER", True, (255, 100, 100))
+        font = get_font(None, 72)
+        title = get_text_surface(font, "GAME OVER", (255, 100, 100))
         title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
         screen.blit(title, title_rect)
         
-        font_small = pygame.font.Font(None, 36)
-        info = font_small.render("You were caught!", True, (255, 200, 200))
+        font_small = get_font(None, 36)
+        info = get_text_surface(font_small, "You were caught!", (255, 200, 200))
         info_rect = info.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
         screen.blit(info, info_rect)
         
-        prompt = font_small.render("ENTER: Retry  |  ESC: Main Menu", True, (150, 150, 150))
+        prompt = get_text_surface(font_small, "ENTER: Retry  |  ESC: Main Menu", (150, 150, 150))
         prompt_rect = prompt.get_rect(center=(self.screen_width // 2, self.screen_height * 2 // 3))
         screen.blit(prompt, prompt_rect)
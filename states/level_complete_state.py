@@ -8,6 +8,7 @@ import pygame
 from .base_state import BaseState
 from core.state_machine import StateType
 from core.logger import get_logger
+from managers.font_cache import get_font, get_text_surface
 
 if TYPE_CHECKING:
     from game_engine import GameEngine
@@ -44,16 +45,15 @@ class LevelCompleteState(BaseState):
         """Render level complete screen."""
         screen.fill((20, 40, 20))
         
-        font = pygame.font.Font(None, 72)
-        title = font.render("LEVEL COMPLETE", True, (100, 255, 100))
+        font = get_font(None, 72)
+        title = get_text_surface(font, "LEVEL COMPLETE", (100, 255, 100))
         title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
-        screen.blit(title, title_rect)
         
-        font_small = pygame.font.Font(None, 36)
-        info = font_small.render(f"Level {self.engine.current_level} cleared!", True, (200, 255, 200))
+        font_small = get_font(None, 36)
+        info = get_text_surface(font_small, f"Level {self.engine.current_level} cleared!", (200, 255, 200))
         info_rect = info.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-        screen.blit(info, info_rect)
         
-        prompt = font_small.render("Press ENTER to continue", True, (150, 150, 150))
+        prompt = get_text_surface(font_small, "Press ENTER to continue", (150, 150, 150))
         prompt_rect = prompt.get_rect(center=(self.screen_width // 2, self.screen_height * 2 // 3))
-        screen.blit(prompt, prompt_rect)
+        
+        screen.blits([(title, title_rect), (info, info_rect), (prompt, prompt_rect)], doreturn=False)
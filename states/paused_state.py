@@ -7,6 +7,7 @@ import pygame
 
 from .base_state import BaseState
 from core.state_machine import StateType
+from managers.font_cache import get_font, get_text_surface
 
 if TYPE_CHECKING:
     from game_engine import GameEngine
@@ -61,16 +62,17 @@ class PausedState(BaseState):
         overlay.fill((0, 0, 0, 150))
         screen.blit(overlay, (0, 0))
         
-        # Pause text
-        font = pygame.font.Font(None, 72)
-        title = font.render("PAUSED", True, (255, 255, 255))
+        # Pause text and menu options, drawn in one call
+        font = get_font(None, 72)
+        title = get_text_surface(font, "PAUSED", (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
-        screen.blit(title, title_rect)
+        items = [(title, title_rect)]
         
         # Menu options
-        font_small = pygame.font.Font(None, 48)
+        font_small = get_font(None, 48)
         for i, option in enumerate(self.options):
             color = (255, 255, 0) if i == self.selected_option else (200, 200, 200)
-            text = font_small.render(option, True, color)
+            text = get_text_surface(font_small, option, color)
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + i * 60))
-            screen.blit(text, text_rect)
+            items.append((text, text_rect))
+        screen.blits(items, doreturn=False)
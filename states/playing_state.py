@@ -7,7 +7,9 @@ import pygame
 
 from .base_state import BaseState
 from core.state_machine import StateType
-from config import BuildCosts, get_level_config, GRAY
+from config import BuildCosts, get_level_config, GRAY, MAX_DETECTION_RANGE, TILE_WIDTH, TILE_HEIGHT
+from systems.detection import detect_player
+from entities.tile import TileType
 from core.logger import get_logger
 
 if TYPE_CHECKING:
@@ -15,6 +17,10 @@ if TYPE_CHECKING:
 
 logger = get_logger('playing_state')
 
+# Tile half-sizes used to map mouse positions to grid cells
+HALF_TILE_WIDTH = TILE_WIDTH / 2
+HALF_TILE_HEIGHT = TILE_HEIGHT / 2
+
 
 class PlayingState(BaseState):
     """
@@ -32,6 +38,10 @@ class PlayingState(BaseState):
         logger.debug("Entering playing state")
         # Register callbacks
         self.engine.trap_menu.on_build_callback = self._build_trap
+        # Exit position of the current level, found on first use
+        self._exit_pos: tuple[int, int] | None = None
+        # (hover tile, player tile, grid version) of the current preview path
+        self._hover_key: tuple | None = None
     
     def exit(self) -> None:
         """Called when leaving playing state."""
@@ -116,94 +126,104 @@ class PlayingState(BaseState):
     def update(self, dt: float) -> StateType | None:
         """Update gameplay logic."""
         self.engine.level_time += dt
+        now = self.engine.level_time
+        # Engine subsystems looked up once for the whole update
+        player = self.engine.player
+        grid = self.engine.grid
+        pathfinding = self.engine.pathfinding
+        enemy_index = self.engine.enemy_index
+        damage_manager = self.engine.damage_manager
+        enemies = self.engine.enemies
+        shadows = self.engine.shadows
         
         # Update player
-        self.engine.player.update(dt, self.engine.grid)
-        if not self.engine.player.moving and self.engine.player.path:
-            nx, ny = self.engine.player.path.pop(0)
-            self.engine.player.start_move_to(nx, ny, self.engine.grid)
+        player.update(dt, grid)
+        if not player.moving and player.path:
+            nx, ny = player.path.pop(0)
+            player.start_move_to(nx, ny, grid)
         
         # Update BFS animation
-        self.engine.renderer.update_bfs_animation(dt, self.engine.grid)
+        self.engine.renderer.update_bfs_animation(dt, grid)
         
         # Update enemies
         self.engine.enemy_timer += dt
-        for enemy in self.engine.enemies:
-            enemy.update(dt, self.engine.player, self.engine.grid, self.engine.pathfinding)
-            enemy.move_step(dt)
+        # Batch detection scan over enemies in cells near the player
+        px, py = player.ix, player.iy
+        detected = detect_player(
+            enemy_index.query(px, py, MAX_DETECTION_RANGE), px, py
+        )
+        for enemy in enemies:
+            enemy.update(dt, now, player, grid, pathfinding,
+                         player_detected=enemy in detected)
+            enemy.move_step(dt, now)
+            enemy_index.update(enemy)
             
             # Check if caught
-            if enemy.check_caught_player(self.engine.player):
-                dmg = enemy.attack_player(self.engine.player)
+            if enemy.check_caught_player(player, now):
+                dmg = enemy.attack_player(player, now)
                 if dmg > 0:
-                    self.engine.damage_manager.add(
-                        self.engine.player.x, self.engine.player.y, 
+                    damage_manager.add(
+                        player.x, player.y, 
                         dmg, color=(200, 0, 0)
                     )
                     logger.info("Enemy %s hit player for %d damage", enemy.type_name, dmg)
                     
                     # Check player death
-                    if self.engine.player.is_dead:
+                    if player.is_dead:
                         return StateType.GAME_OVER
         
         if self.engine.enemy_timer > 0.1:
             self.engine.enemy_timer = 0.0
         
         # Grant resources for killed enemies before removing them
-        for enemy in self.engine.enemies:
-            if enemy.is_dead:
-                # Resource drop based on enemy type
-                resource_drops = {
-                    'security_agent': 10,
-                    'elf': 20,
-                    'alpha_bear': 12
-                }
-                drop_amount = resource_drops.get(enemy.enemy_type, 10)
-                self.engine.player.resources += drop_amount
-                
-                # Show resource pickup notification at player position (more visible)
-                self.engine.damage_manager.add(
-                    self.engine.player.x, self.engine.player.y,
-                    f"+{drop_amount} DATA",
-                    color=(50, 255, 50),  # Green for resources
-                    is_crit=True  # Make it larger
-                )
-                logger.info("Enemy %s killed! Gained %d resources", enemy.type_name, drop_amount)
-        
-        # Remove dead enemies
-        self.engine.enemies = [e for e in self.engine.enemies if not e.is_dead]
+        dead_enemies = [e for e in enemies if e.is_dead]
+        for enemy in dead_enemies:
+            # Resource drop based on enemy type
+            resource_drops = {
+                'security_agent': 10,
+                'elf': 20,
+                'alpha_bear': 12
+            }
+            drop_amount = resource_drops.get(enemy.enemy_type, 10)
+            player.resources += drop_amount
+            
+            # Show resource pickup notification at player position (more visible)
+            damage_manager.add(
+                player.x, player.y,
+                f"+{drop_amount} DATA",
+                color=(50, 255, 50),  # Green for resources
+                is_crit=True  # Make it larger
+            )
+            logger.info("Enemy %s killed! Gained %d resources", enemy.type_name, drop_amount)
+            enemy_index.remove(enemy)
+            # Remove dead enemy; the list is the alive set
+            enemies.swap_remove(enemy)
         
         # Check traps on enemies
         self._check_trap_triggers()
         
         # Update tiles (trap cooldowns)
-        if self.engine.grid:
-            for y in range(self.engine.grid.height):
-                for x in range(self.engine.grid.width):
-                    tile = self.engine.grid.get_tile(x, y)
-                    if tile:
-                        tile.update(dt)
+        if grid:
+            grid.update_tiles(dt)
         
         # Update damage numbers
-        self.engine.damage_manager.update(dt)
+        damage_manager.update(dt)
         
         # Update combat effects
         self.engine.combat_manager.update(dt)
         
         # Update shadows
-        for shadow in self.engine.shadows:
-            shadow.update(dt, self.engine.player, self.engine.enemies, 
-                         self.engine.grid, self.engine.pathfinding)
+        for shadow in shadows:
+            shadow.update(dt, now, player, enemies, 
+                         grid, pathfinding)
         
         # Remove dead shadows
-        self.engine.shadows = [s for s in self.engine.shadows if not s.is_dead]
-        
-        # Update camera
-        self.engine.camera.update(self.engine.player, self.screen_width, self.screen_height)
+        for shadow in [s for s in shadows if s.is_dead]:
+            shadows.swap_remove(shadow)
         
         # Check win condition
         exit_pos = self._get_exit_pos()
-        if (int(self.engine.player.x), int(self.engine.player.y)) == exit_pos:
+        if (player.ix, player.iy) == exit_pos:
             return StateType.LEVEL_COMPLETE
         
         return None
@@ -212,10 +232,17 @@ class PlayingState(BaseState):
         """Render the game."""
         screen.fill((20, 20, 30))
         
+        # Camera eases once per rendered frame, following the interpolated player
+        lookahead = self.engine.sim_lag
+        self.engine.camera.update(
+            self.engine.player, self.screen_width, self.screen_height, lookahead
+        )
+        
         self.engine.renderer.render_game(
             screen, self.engine.grid, self.engine.player, 
             self.engine.enemies, self.engine.shadows,
-            self.engine.camera, self.screen_width, self.screen_height
+            self.engine.camera, self.screen_width, self.screen_height,
+            lookahead
         )
         
         # Render damage numbers
@@ -249,7 +276,7 @@ class PlayingState(BaseState):
         """Perform animated BFS scan to reveal tiles around player."""
         # Use layered BFS for wave animation
         layers = self.engine.pathfinding.bfs_scan_layered(
-            (int(self.engine.player.x), int(self.engine.player.y)), 
+            (self.engine.player.ix, self.engine.player.iy), 
             self.engine.grid, radius=5
         )
         # Start the animation in renderer
@@ -258,8 +285,8 @@ class PlayingState(BaseState):
     def _build_action(self, type_str: str) -> None:
         """Build wall at player position."""
         tile = self.engine.grid.get_tile(
-            int(self.engine.player.x), 
-            int(self.engine.player.y)
+            self.engine.player.ix, 
+            self.engine.player.iy
         )
         if not tile:
             return
@@ -270,6 +297,7 @@ class PlayingState(BaseState):
                 self.engine.player.resources -= cost
                 tile.type = 'wall'
                 tile.cost = 999
+                self.engine.grid.mark_changed()
                 self.engine.sounds.play('build')
     
     def _build_trap(self, trap_type: str) -> bool:
@@ -281,8 +309,8 @@ class PlayingState(BaseState):
             bool: True if built successfully
         """
         tile = self.engine.grid.get_tile(
-            int(self.engine.player.x),
-            int(self.engine.player.y)
+            self.engine.player.ix,
+            self.engine.player.iy
         )
         if not tile:
             return False
@@ -295,14 +323,16 @@ class PlayingState(BaseState):
             tile.type = 'trap'
             tile.trap_type = trap_type
             tile.cost = 5
+            self.engine.grid.mark_changed()
             return True
             
         return False
     
     def _dismiss_shadow(self) -> None:
-        """Dismiss last shadow and refund resources."""
+        """Dismiss the most recently summoned shadow and refund resources."""
         if self.engine.shadows:
-            dismissed = self.engine.shadows.pop()
+            dismissed = max(self.engine.shadows, key=lambda shadow: shadow.summon_number)
+            self.engine.shadows.swap_remove(dismissed)
             self.engine.player.resources += dismissed.cost
             self.engine.sounds.play('build')
     
@@ -313,7 +343,11 @@ class PlayingState(BaseState):
 
     def _perform_melee_attack(self) -> None:
         """Execute player melee attack."""
-        hits = self.engine.player.attack(self.engine.enemies)
+        player = self.engine.player
+        # Only enemies in index cells within melee reach are candidates
+        # (1.5 tiles, plus up to one tile of in-progress movement)
+        nearby = self.engine.enemy_index.query(player.ix, player.iy, 3)
+        hits = player.attack(nearby, self.engine.level_time)
         if hits:
             self.engine.sounds.play('build')  # Reuse build sound
             for enemy in hits:
@@ -339,24 +373,17 @@ class PlayingState(BaseState):
     def _perform_skill_attack_mouse(self, pos: tuple[int, int]) -> None:
         """Execute player ranged skill attack (Mouse click)."""
         # Convert screen pos to grid pos
-        from config import TILE_WIDTH, TILE_HEIGHT
-        
-        mx, my = pos
-        world_offset = self.engine.camera.get_world_offset(
-            self.screen_width, self.screen_height
-        )
-        world_x = mx - world_offset[0] - self.engine.camera.x
-        world_y = my - world_offset[1] - self.engine.camera.y
-        fx = world_x / (TILE_WIDTH / 2)
-        fy = world_y / (TILE_HEIGHT / 2)
-        gx = int(round((fx + fy) / 2))
-        gy = int(round((fy - fx) / 2))
-        
-        self._execute_skill_at((gx, gy))
+        self._execute_skill_at(self._screen_to_grid(pos))
 
     def _execute_skill_at(self, target_pos: tuple[int, int]) -> None:
         """Helper to run skill logic."""
-        hit_enemy = self.engine.player.skill_dagger_throw(target_pos, self.engine.enemies)
+        # Only enemies in index cells around the target tile can be hit.
+        # The first match is hit, so scan them in enemy list order.
+        nearby = self.engine.enemy_index.query(target_pos[0], target_pos[1], 1)
+        nearby.sort(key=lambda enemy: enemy.slot)
+        hit_enemy = self.engine.player.skill_dagger_throw(
+            target_pos, nearby, self.engine.level_time
+        )
         if hit_enemy:
             self.engine.sounds.play('build')
             
@@ -385,18 +412,24 @@ class PlayingState(BaseState):
     
     def _check_trap_triggers(self) -> None:
         """Check if any enemies are standing on traps and trigger damage."""
+        grid = self.engine.grid
+        damage_manager = self.engine.damage_manager
         for enemy in self.engine.enemies:
-            tile = self.engine.grid.get_tile(enemy.x, enemy.y)
-            if tile and tile.type == 'trap':
+            tile = grid.get_tile(enemy.x, enemy.y)
+            if tile and tile.code == TileType.TRAP:
                 effect_data = tile.trigger_trap(enemy)
                 if effect_data:
+                    # Cooldown started; tick it in update_tiles
+                    grid.start_ticking(enemy.x, enemy.y)
+                    
                     # Apply status effect
                     if effect_data['effect'] in ['freeze', 'slow']:
-                        enemy.apply_effect(effect_data['effect'], effect_data['duration'])
+                        enemy.apply_effect(effect_data['effect'], effect_data['duration'],
+                                           self.engine.level_time)
                         
                     # Add floating damage number if damage was dealt
                     if effect_data['damage'] > 0:
-                        self.engine.damage_manager.add(
+                        damage_manager.add(
                             enemy.x, enemy.y, 
                             effect_data['damage'], 
                             color=(255, 150, 50)  # Orange for trap damage
@@ -406,22 +439,11 @@ class PlayingState(BaseState):
     
     def _handle_mouse_click(self, pos: tuple[int, int]) -> None:
         """Handle mouse click for pathfinding movement."""
-        from config import TILE_WIDTH, TILE_HEIGHT
-        
-        mx, my = pos
-        world_offset = self.engine.camera.get_world_offset(
-            self.screen_width, self.screen_height
-        )
-        world_x = mx - world_offset[0] - self.engine.camera.x
-        world_y = my - world_offset[1] - self.engine.camera.y
-        fx = world_x / (TILE_WIDTH / 2)
-        fy = world_y / (TILE_HEIGHT / 2)
-        gx = int(round((fx + fy) / 2))
-        gy = int(round((fy - fx) / 2))
+        gx, gy = self._screen_to_grid(pos)
         
         if 0 <= gx < self.engine.grid.width and 0 <= gy < self.engine.grid.height:
             path = self.engine.pathfinding.a_star(
-                (int(self.engine.player.x), int(self.engine.player.y)), 
+                (self.engine.player.ix, self.engine.player.iy), 
                 (gx, gy), 
                 self.engine.grid
             )
@@ -431,42 +453,52 @@ class PlayingState(BaseState):
                     nx, ny = self.engine.player.path.pop(0)
                     self.engine.player.start_move_to(nx, ny, self.engine.grid)
     
+    def _screen_to_grid(self, pos: tuple[int, int]) -> tuple[int, int]:
+        """Grid cell under a screen position (may lie outside the grid)."""
+        mx, my = pos
+        camera = self.engine.camera
+        offset_x, offset_y = camera.get_world_offset(self.screen_width, self.screen_height)
+        fx = (mx - offset_x - camera.x) / HALF_TILE_WIDTH
+        fy = (my - offset_y - camera.y) / HALF_TILE_HEIGHT
+        return int(round((fx + fy) / 2)), int(round((fy - fx) / 2))
+    
     def _get_exit_pos(self) -> tuple[int, int]:
-        """Find exit position on grid."""
-        for y in range(self.engine.grid.height):
-            for x in range(self.engine.grid.width):
-                tile = self.engine.grid.get_tile(x, y)
-                if tile and tile.type == 'exit':
-                    return (x, y)
-        return (self.engine.grid.width - 1, self.engine.grid.height - 1)
+        """
+        Find exit position on grid.
+        The exit never moves during a level, so the scan runs once and the
+        result is kept until the state is entered again.
+        """
+        if self._exit_pos is not None:
+            return self._exit_pos
+        self._exit_pos = self._find_exit_pos()
+        return self._exit_pos
+    
+    def _find_exit_pos(self) -> tuple[int, int]:
+        """Look up the exit tile, falling back to the far corner."""
+        grid = self.engine.grid
+        exit_pos = grid.find_tile(TileType.EXIT)
+        if exit_pos is None:
+            return (grid.width - 1, grid.height - 1)
+        return exit_pos
     
     def _update_hover_tile(self, pos: tuple[int, int]) -> None:
         """Update the hovered tile based on mouse position."""
-        from config import TILE_WIDTH, TILE_HEIGHT
-        
-        mx, my = pos
-        world_offset = self.engine.camera.get_world_offset(
-            self.screen_width, self.screen_height
-        )
-        world_x = mx - world_offset[0] - self.engine.camera.x
-        world_y = my - world_offset[1] - self.engine.camera.y
-        fx = world_x / (TILE_WIDTH / 2)
-        fy = world_y / (TILE_HEIGHT / 2)
-        gx = int(round((fx + fy) / 2))
-        gy = int(round((fy - fx) / 2))
+        gx, gy = self._screen_to_grid(pos)
         
         # Update renderer's hover tile
         if 0 <= gx < self.engine.grid.width and 0 <= gy < self.engine.grid.height:
             self.engine.renderer.hover_tile = (gx, gy)
             
-            # Calculate preview path
-            path = self.engine.pathfinding.a_star(
-                (int(self.engine.player.x), int(self.engine.player.y)),
-                (gx, gy),
-                self.engine.grid
-            )
-            self.engine.renderer.preview_path = path if path else []
+            # Calculate preview path, unless nothing it depends on has changed
+            start = (self.engine.player.ix, self.engine.player.iy)
+            key = ((gx, gy), start, self.engine.grid.version)
+            if key == self._hover_key:
+                return
+            self._hover_key = key
+            path = self.engine.pathfinding.a_star(start, (gx, gy), self.engine.grid)
+            self.engine.renderer.preview_path = set(path) if path else set()
         else:
+            self._hover_key = None
             self.engine.renderer.hover_tile = None
-            self.engine.renderer.preview_path = []
+            self.engine.renderer.preview_path = set()
 
@@ -8,6 +8,7 @@ import pygame
 from .base_state import BaseState
 from core.state_machine import StateType
 from core.logger import get_logger
+from managers.font_cache import get_font, get_text_surface
 
 if TYPE_CHECKING:
     from game_engine import GameEngine
@@ -40,17 +41,17 @@ class VictoryState(BaseState):
         """Render victory screen."""
         screen.fill((20, 20, 50))
         
-        font = pygame.font.Font(None, 72)
-        title = font.render("VICTORY!", True, (255, 215, 0))
+        font = get_font(None, 72)
+        title = get_text_surface(font, "VICTORY!", (255, 215, 0))
         title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
         screen.blit(title, title_rect)
         
-        font_medium = pygame.font.Font(None, 48)
-        subtitle = font_medium.render("ALL LEVELS COMPLETE", True, (200, 200, 255))
+        font_medium = get_font(None, 48)
+        subtitle = get_text_surface(font_medium, "ALL LEVELS COMPLETE", (200, 200, 255))
         subtitle_rect = subtitle.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
         screen.blit(subtitle, subtitle_rect)
         
-        font_small = pygame.font.Font(None, 36)
-        prompt = font_small.render("Press ENTER to return to menu", True, (150, 150, 150))
+        font_small = get_font(None, 36)
+        prompt = get_text_surface(font_small, "Press ENTER to return to menu", (150, 150, 150))
         prompt_rect = prompt.get_rect(center=(self.screen_width // 2, self.screen_height * 2 // 3))
         screen.blit(prompt, prompt_rect)
@@ -1,5 +1,7 @@
 """Systems package for Solo Leveling game."""
 from .pathfinding import Pathfinding
+from .spatial_index import SpatialIndex
+from .detection import detect_player
 from .input_handler import (
     InputHandler, 
     InputAction, 
@@ -0,0 +1,20 @@
+"""
+Batch detection scan for enemy AI.
+Checks every candidate enemy against the player tile in one pass.
+"""
+
+
+def detect_player(enemies, px, py):
+    """
+    Enemies whose detection range covers the player tile (px, py).
+    
+    Uses the same Manhattan test as Enemy.update, so the result can be
+    passed straight through as its player_detected argument.
+    
+    Returns:
+        set of detecting enemies
+    """
+    return {
+        e for e in enemies
+        if abs(e.x - px) + abs(e.y - py) < e.detection_range
+    }
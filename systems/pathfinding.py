@@ -5,9 +5,28 @@ Includes A* and BFS for fog of war scanning.
 import heapq
 import collections
 
+from entities.tile import TileType
+
+# Goals kept in the heuristic memo before it is flushed
+H_CACHE_MAX_GOALS = 64
+
+# 4-connected neighbour offsets
+NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
 class Pathfinding:
     """Utility class for pathfinding algorithms."""
     
+    def __init__(self):
+        # Reverse-Dijkstra parent map shared by all callers heading to one goal
+        self._shared_cache_key = None
+        self._shared_cache: dict = {}
+        
+        # Heuristic tables: goal -> flat list of h indexed x * height + y,
+        # valid for one grid size
+        self._h_cache_key = None
+        self._h_cache: dict[tuple[int, int], list[int]] = {}
+    
     @staticmethod
     def bfs_scan(start_pos, grid_obj, radius=4):
         """
@@ -41,6 +60,24 @@ class Pathfinding:
                         queue.append((nx, ny))
         return revealed_tiles
     
+    @staticmethod
+    def reveal_scan(start_pos, grid_obj, radius=4):
+        """
+        Mark every tile bfs_scan would return as visible, in place.
+        The scan ignores walls, so BFS depth equals Manhattan distance and
+        the reached set is the clipped diamond around start_pos; each
+        column of it is written straight into grid_obj.visible_map.
+        """
+        sx, sy = start_pos
+        width, height = grid_obj.width, grid_obj.height
+        visible = grid_obj.visible_map
+        for x in range(max(0, sx - radius), min(width, sx + radius + 1)):
+            reach = radius - abs(x - sx)
+            y0 = max(0, sy - reach)
+            y1 = min(height, sy + reach + 1)
+            base = x * height
+            visible[base + y0:base + y1] = b'\x01' * (y1 - y0)
+    
     @staticmethod
     def bfs_scan_layered(start_pos, grid_obj, radius=5):
         """
@@ -82,44 +119,69 @@ class Pathfinding:
         
         return layers
     
-    @staticmethod
-    def a_star(start, goal, grid_obj):
+    def _heuristic_table(self, goal, grid_obj):
+        """
+        Manhattan distance to goal for every tile, indexed x * height + y.
+        Built once per goal and shared by every search towards it.
+        """
+        width, height = grid_obj.width, grid_obj.height
+        key = (width, height)
+        if key != self._h_cache_key or len(self._h_cache) >= H_CACHE_MAX_GOALS:
+            self._h_cache.clear()
+            self._h_cache_key = key
+        table = self._h_cache.get(goal)
+        if table is None:
+            gx, gy = goal
+            column = [abs(y - gy) for y in range(height)]
+            table = self._h_cache[goal] = [
+                h + abs(x - gx) for x in range(width) for h in column
+            ]
+        return table
+    
+    def a_star(self, start, goal, grid_obj):
         """
         A* pathfinding algorithm.
         Returns path from start to goal as list of coordinates.
         """
+        h_table = self._heuristic_table(goal, grid_obj)
         frontier = []
         heapq.heappush(frontier, (0, start))
         came_from = {start: None}
         cost_so_far = {start: 0}
         
+        # Hoist everything the inner loop touches into locals
+        width, height = grid_obj.width, grid_obj.height
+        type_map = grid_obj.type_map
+        cost_map = grid_obj.cost_map
+        wall = int(TileType.WALL)
+        heappush, heappop = heapq.heappush, heapq.heappop
+        
         while frontier:
-            _, current = heapq.heappop(frontier)
+            _, current = heappop(frontier)
             
             if current == goal:
                 break
             
             cx, cy = current
-            neighbors = [
-                (cx+1, cy), (cx-1, cy), (cx, cy+1), (cx, cy-1)
-            ]
+            current_cost = cost_so_far[current]
             
-            for next_node in neighbors:
-                nx, ny = next_node
-                # Check bounds
-                if 0 <= nx < grid_obj.width and 0 <= ny < grid_obj.height:
-                    tile = grid_obj.get_tile(nx, ny)
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                # Walls straight from the type map: cannot walk through walls
+                index = nx * height + ny
+                if type_map[index] == wall:
+                    continue
                     
-                    # Logic: Cannot walk through walls
-                    if tile.type == 'wall':
-                        continue
-                        
-                    new_cost = cost_so_far[current] + tile.cost
-                    if next_node not in cost_so_far or new_cost < cost_so_far[next_node]:
-                        cost_so_far[next_node] = new_cost
-                        priority = new_cost + Pathfinding.heuristic(next_node, goal)
-                        heapq.heappush(frontier, (priority, next_node))
-                        came_from[next_node] = current
+                next_node = (nx, ny)
+                new_cost = current_cost + cost_map[index]
+                old_cost = cost_so_far.get(next_node)
+                if old_cost is None or new_cost < old_cost:
+                    cost_so_far[next_node] = new_cost
+                    heappush(frontier, (new_cost + h_table[index], next_node))
+                    came_from[next_node] = current
         
         # Reconstruct path
         path = []
@@ -131,6 +193,171 @@ class Pathfinding:
             path.reverse()
         return path
     
+    def jps(self, start, goal, grid_obj):
+        """
+        Jump Point Search for 4-connected, uniform-cost grids.
+        Expands only jump points, then fills in the straight segments.
+        Falls back to a_star when the grid has weighted tiles (traps).
+        Returns path from start to goal as list of coordinates.
+        """
+        if not grid_obj.has_uniform_cost():
+            return self.a_star(start, goal, grid_obj)
+        if not grid_obj.is_walkable(*goal):
+            return []
+        
+        is_walkable = grid_obj.is_walkable
+        frontier = [(0, start)]
+        came_from = {start: None}
+        cost_so_far = {start: 0}
+        
+        while frontier:
+            _, current = heapq.heappop(frontier)
+            
+            if current == goal:
+                break
+            
+            for dx, dy in Pathfinding._jps_directions(current, came_from[current], is_walkable):
+                jump_point = Pathfinding._jump(current[0] + dx, current[1] + dy, dx, dy, goal, is_walkable)
+                if jump_point is None:
+                    continue
+                
+                new_cost = cost_so_far[current] + Pathfinding.heuristic(current, jump_point)
+                if jump_point not in cost_so_far or new_cost < cost_so_far[jump_point]:
+                    cost_so_far[jump_point] = new_cost
+                    priority = new_cost + Pathfinding.heuristic(jump_point, goal)
+                    heapq.heappush(frontier, (priority, jump_point))
+                    came_from[jump_point] = current
+        
+        # Reconstruct path, expanding each jump into single steps
+        path = []
+        if goal in came_from:
+            cur = goal
+            while cur != start:
+                prev = came_from[cur]
+                step_x = (cur[0] > prev[0]) - (cur[0] < prev[0])
+                step_y = (cur[1] > prev[1]) - (cur[1] < prev[1])
+                x, y = cur
+                while (x, y) != prev:
+                    path.append((x, y))
+                    x -= step_x
+                    y -= step_y
+                cur = prev
+            path.reverse()
+        return path
+    
+    @staticmethod
+    def _jps_directions(node, parent, is_walkable):
+        """Pruned search directions for a node given the direction it was reached from."""
+        x, y = node
+        if parent is None:
+            return [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+        directions = [(dx, dy)]
+        # Turning is only useful at jump points, which is where we are
+        if dx != 0:
+            if is_walkable(x, y - 1):
+                directions.append((0, -1))
+            if is_walkable(x, y + 1):
+                directions.append((0, 1))
+        else:
+            if is_walkable(x - 1, y):
+                directions.append((-1, 0))
+            if is_walkable(x + 1, y):
+                directions.append((1, 0))
+        return directions
+    
+    @staticmethod
+    def _jump(x, y, dx, dy, goal, is_walkable):
+        """
+        Walk from (x, y) in direction (dx, dy) until a jump point is found.
+        Returns the jump point, or None if the walk hits a wall.
+        """
+        while True:
+            if not is_walkable(x, y):
+                return None
+            if (x, y) == goal:
+                return (x, y)
+            
+            if dx != 0:
+                # Forced neighbor: an opening above/below that was blocked behind us
+                if ((is_walkable(x, y - 1) and not is_walkable(x - dx, y - 1)) or
+                        (is_walkable(x, y + 1) and not is_walkable(x - dx, y + 1))):
+                    return (x, y)
+            else:
+                if ((is_walkable(x - 1, y) and not is_walkable(x - 1, y - dy)) or
+                        (is_walkable(x + 1, y) and not is_walkable(x + 1, y - dy))):
+                    return (x, y)
+                # Vertical moves stop wherever a horizontal scan finds a jump point
+                if (Pathfinding._jump(x + 1, y, 1, 0, goal, is_walkable) or
+                        Pathfinding._jump(x - 1, y, -1, 0, goal, is_walkable)):
+                    return (x, y)
+            
+            x += dx
+            y += dy
+    
+    @staticmethod
+    def reverse_dijkstra(goal, grid_obj):
+        """
+        Dijkstra search outward from the goal.
+        Returns a parent map: each reachable tile -> next tile towards goal.
+        Edge costs match a_star (entering a tile costs its cost_map entry).
+        """
+        if not grid_obj.is_walkable(*goal):
+            return {}
+        is_walkable = grid_obj.is_walkable
+        cost_map = grid_obj.cost_map
+        height = grid_obj.height
+        
+        frontier = [(0, goal)]
+        parents = {goal: None}
+        dist = {goal: 0}
+        
+        while frontier:
+            d, current = heapq.heappop(frontier)
+            if d > dist[current]:
+                continue
+            
+            cx, cy = current
+            # Walls can be a start tile but are never stepped through
+            if not is_walkable(cx, cy):
+                continue
+            
+            new_cost = d + cost_map[cx * height + cy]
+            neighbors = [
+                (cx+1, cy), (cx-1, cy), (cx, cy+1), (cx, cy-1)
+            ]
+            for prev_node in neighbors:
+                nx, ny = prev_node
+                if 0 <= nx < grid_obj.width and 0 <= ny < grid_obj.height:
+                    if prev_node not in dist or new_cost < dist[prev_node]:
+                        dist[prev_node] = new_cost
+                        parents[prev_node] = current
+                        heapq.heappush(frontier, (new_cost, prev_node))
+        return parents
+    
+    def shared_path_to(self, goal, grid_obj, start):
+        """
+        Path from start to goal, read from a parent map shared by all callers.
+        The map is rebuilt only when the goal or the grid version changes.
+        """
+        key = (grid_obj, grid_obj.version, goal)
+        if key != self._shared_cache_key:
+            self._shared_cache = Pathfinding.reverse_dijkstra(goal, grid_obj)
+            self._shared_cache_key = key
+        
+        parents = self._shared_cache
+        if start not in parents:
+            return []
+        
+        path = []
+        cur = start
+        while cur != goal:
+            cur = parents[cur]
+            path.append(cur)
+        return path
+    
     @staticmethod
     def heuristic(a, b):
         """Manhattan distance heuristic."""
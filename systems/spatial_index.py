@@ -0,0 +1,82 @@
+"""
+Uniform-grid spatial index for neighbourhood queries.
+Buckets entities by coarse cell so callers only look at nearby ones.
+"""
+import collections
+
+
+class SpatialIndex:
+    """
+    Buckets entities by coarse grid cell.
+
+    Usage:
+        index = SpatialIndex(cell_size=8)
+        index.rebuild(enemies)
+        index.update(enemy)          # after the enemy moves
+        nearby = index.query(px, py, radius)
+    """
+
+    def __init__(self, cell_size=8):
+        self.cell_size = cell_size
+        self._buckets = collections.defaultdict(list)
+        self._cells = {}  # entity -> cell it is filed under
+
+    def _cell_of(self, x, y):
+        """Coarse cell containing grid position (x, y)."""
+        return (int(x) // self.cell_size, int(y) // self.cell_size)
+
+    def clear(self):
+        """Remove all entities."""
+        self._buckets.clear()
+        self._cells.clear()
+
+    def rebuild(self, entities):
+        """Re-index from scratch."""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity):
+        """Add an entity at its current position."""
+        cell = self._cell_of(entity.x, entity.y)
+        self._buckets[cell].append(entity)
+        self._cells[entity] = cell
+
+    def remove(self, entity):
+        """Remove an entity if it is indexed."""
+        cell = self._cells.pop(entity, None)
+        if cell is None:
+            return
+        bucket = self._buckets[cell]
+        bucket.remove(entity)
+        if not bucket:
+            del self._buckets[cell]
+
+    def update(self, entity):
+        """Move an entity to a new bucket if it crossed a cell border."""
+        cell = self._cell_of(entity.x, entity.y)
+        old_cell = self._cells.get(entity)
+        if cell == old_cell:
+            return
+        if old_cell is not None:
+            self.remove(entity)
+        self._buckets[cell].append(entity)
+        self._cells[entity] = cell
+
+    def query(self, x, y, radius):
+        """
+        Entities in cells overlapping the square of given radius around (x, y).
+        Returns a list holding a superset of entities within Manhattan
+        distance radius, in a deterministic order (cell by cell, then
+        insertion order). Each entity is filed under one cell, so there
+        are no duplicates.
+        """
+        min_cx, min_cy = self._cell_of(x - radius, y - radius)
+        max_cx, max_cy = self._cell_of(x + radius, y + radius)
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self._buckets.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import pygame
 
+from managers.font_cache import get_font
+
 
 @dataclass
 class DamageNumber:
@@ -46,7 +48,7 @@ class DamageNumberManager:
     def _ensure_font(self) -> None:
         """Initialize font if needed."""
         if self.font is None:
-            self.font = pygame.font.Font(None, 28)
+            self.font = get_font(None, 28)
     
     def add(
         self, 
@@ -7,6 +7,7 @@ import math
 import time
 from config.settings import MAX_LEVELS, RESPONSIVE_SCALE, SHADOW_TYPES
 from config.constants import WHITE, CYAN, GREEN, RED
+from managers.font_cache import get_font, get_text_surface
 
 
 class HUD:
@@ -26,9 +27,9 @@ class HUD:
         
         # Create custom fonts
         try:
-            self.title_font = pygame.font.SysFont('Consolas', max(18, int(22 * RESPONSIVE_SCALE)), bold=True)
-            self.body_font = pygame.font.SysFont('Consolas', max(14, int(16 * RESPONSIVE_SCALE)))
-            self.small_font = pygame.font.SysFont('Consolas', max(12, int(14 * RESPONSIVE_SCALE)))
+            self.title_font = get_font('Consolas', max(18, int(22 * RESPONSIVE_SCALE)), bold=True)
+            self.body_font = get_font('Consolas', max(14, int(16 * RESPONSIVE_SCALE)))
+            self.small_font = get_font('Consolas', max(12, int(14 * RESPONSIVE_SCALE)))
         except:
             self.title_font = self.font
             self.body_font = self.font
@@ -60,7 +61,7 @@ class HUD:
         
         # Level info (title style)
         level_text = f"LEVEL {current_level} / {MAX_LEVELS}"
-        level_surf = self.title_font.render(level_text, True, self.TEXT_ACCENT)
+        level_surf = get_text_surface(self.title_font, level_text, self.TEXT_ACCENT)
         screen.blit(level_surf, (hud_x + padding, y))
         y += line_height + 5
         
@@ -92,7 +93,7 @@ class HUD:
         y += 8
         
         # Resources
-        res_label = self.small_font.render("RESOURCES:", True, self.TEXT_SECONDARY)
+        res_label = get_text_surface(self.small_font, "RESOURCES:", self.TEXT_SECONDARY)
         res_value = self.body_font.render(str(player.resources), True, self.TEXT_PRIMARY)
         screen.blit(res_label, (hud_x + padding, y))
         screen.blit(res_value, (hud_x + padding + 90, y))
@@ -100,14 +101,14 @@ class HUD:
         
         # Shadows
         shadow_names = ', '.join([SHADOW_TYPES[s.shadow_type]['name'] for s in shadows]) if shadows else 'None'
-        shd_label = self.small_font.render("SHADOWS:", True, self.TEXT_SECONDARY)
+        shd_label = get_text_surface(self.small_font, "SHADOWS:", self.TEXT_SECONDARY)
         shd_value = self.body_font.render(shadow_names[:20], True, self.TEXT_PRIMARY if shadows else self.TEXT_SECONDARY)
         screen.blit(shd_label, (hud_x + padding, y))
         screen.blit(shd_value, (hud_x + padding + 90, y))
         y += line_height
         
         # Time
-        time_label = self.small_font.render("TIME:", True, self.TEXT_SECONDARY)
+        time_label = get_text_surface(self.small_font, "TIME:", self.TEXT_SECONDARY)
         time_value = self.body_font.render(f"{int(level_time)}s", True, self.TEXT_PRIMARY)
         screen.blit(time_label, (hud_x + padding, y))
         screen.blit(time_value, (hud_x + padding + 90, y))
@@ -122,7 +123,7 @@ class HUD:
         controls1 = "ARROWS/WASD: Move | Q: Slash"
         controls2 = "R-Click: Dagger | R: Arise | B: Wall"
         
-        ctrl1_surf = self.small_font.render(controls1, True, self.TEXT_SECONDARY)
-        ctrl2_surf = self.small_font.render(controls2, True, self.TEXT_SECONDARY)
+        ctrl1_surf = get_text_surface(self.small_font, controls1, self.TEXT_SECONDARY)
+        ctrl2_surf = get_text_surface(self.small_font, controls2, self.TEXT_SECONDARY)
         screen.blit(ctrl1_surf, (hud_x + padding, y))
         screen.blit(ctrl2_surf, (hud_x + padding, y + line_height - 5))
@@ -7,6 +7,7 @@ import math
 import time
 from config.settings import GAME_TITLE, GAME_STORY, RESPONSIVE_SCALE
 from config.constants import CYAN, WHITE, GREEN, YELLOW, RED
+from managers.font_cache import get_font, get_text_surface, get_faded_text_surface
 
 
 class MenuScreens:
@@ -32,10 +33,10 @@ class MenuScreens:
         # Create custom fonts - use larger base sizes for readability
         try:
             # Title: 56-72pt, Subtitle: 20-24pt, Body: 18-22pt, Button: 24-28pt
-            self.title_font = pygame.font.SysFont('Consolas', max(56, int(72 * RESPONSIVE_SCALE)), bold=True)
-            self.subtitle_font = pygame.font.SysFont('Consolas', max(20, int(24 * RESPONSIVE_SCALE)))
-            self.body_font = pygame.font.SysFont('Consolas', max(18, int(22 * RESPONSIVE_SCALE)))
-            self.button_font = pygame.font.SysFont('Consolas', max(24, int(28 * RESPONSIVE_SCALE)), bold=True)
+            self.title_font = get_font('Consolas', max(56, int(72 * RESPONSIVE_SCALE)), bold=True)
+            self.subtitle_font = get_font('Consolas', max(20, int(24 * RESPONSIVE_SCALE)))
+            self.body_font = get_font('Consolas', max(18, int(22 * RESPONSIVE_SCALE)))
+            self.button_font = get_font('Consolas', max(24, int(28 * RESPONSIVE_SCALE)), bold=True)
         except:
             self.title_font = self.large_font
             self.subtitle_font = self.font
@@ -77,23 +78,21 @@ class MenuScreens:
     
     def _draw_glow_text(self, screen, text, font, color, glow_color, pos, center=True):
         """Draw text with a glow effect."""
-        # Render glow
-        glow_surf = font.render(text, True, glow_color)
+        # Render glow (faded surface cached per text and color)
+        alpha_surf = get_faded_text_surface(font, text, glow_color, 30)
         
         # Create blur effect by blitting multiple times with alpha
         for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2), (0, 3), (0, -3), (3, 0), (-3, 0)]:
-            glow_rect = glow_surf.get_rect()
+            glow_rect = alpha_surf.get_rect()
             if center:
                 glow_rect.center = (pos[0] + offset[0], pos[1] + offset[1])
             else:
                 glow_rect.topleft = (pos[0] + offset[0], pos[1] + offset[1])
             
-            alpha_surf = glow_surf.copy()
-            alpha_surf.set_alpha(30)
             screen.blit(alpha_surf, glow_rect)
         
         # Render main text
-        main_surf = font.render(text, True, color)
+        main_surf = get_text_surface(font, text, color)
         main_rect = main_surf.get_rect()
         if center:
             main_rect.center = pos
@@ -213,7 +212,7 @@ class MenuScreens:
                 int(self.TEXT_BRIGHT[1] * (alpha / 255)),
                 int(self.TEXT_BRIGHT[2] * (alpha / 255))
             )
-            text = self.body_font.render(line, True, color)
+            text = get_text_surface(self.body_font, line, color)
             text_rect = text.get_rect(center=(center_x, y + line_height // 2))
             screen.blit(text, text_rect)
             y += line_height
@@ -224,7 +223,7 @@ class MenuScreens:
         
         # Version/credits at bottom
         version = "v1.0 // Digital Architect"
-        ver_surf = self.subtitle_font.render(version, True, self.TEXT_DIM)
+        ver_surf = get_text_surface(self.subtitle_font, version, self.TEXT_DIM)
         screen.blit(ver_surf, (10, screen_height - 25))
         
         # Scanline effect
@@ -268,7 +267,7 @@ class MenuScreens:
         
         # Stats
         stats_text = f"Time: {int(level_time)}s  |  Resources: {player_resources}"
-        stats_surf = self.button_font.render(stats_text, True, self.TEXT_BRIGHT)
+        stats_surf = get_text_surface(self.button_font, stats_text, self.TEXT_BRIGHT)
         stats_rect = stats_surf.get_rect(center=(center_x, center_y))
         screen.blit(stats_surf, stats_rect)
         
@@ -293,7 +292,7 @@ class MenuScreens:
         
         # Message
         msg = "Security protocols activated. Connection terminated."
-        msg_surf = self.body_font.render(msg, True, self.TEXT_DIM)
+        msg_surf = get_text_surface(self.body_font, msg, self.TEXT_DIM)
         msg_rect = msg_surf.get_rect(center=(center_x, center_y + 10))
         screen.blit(msg_surf, msg_rect)
         
@@ -319,7 +318,7 @@ class MenuScreens:
         
         # Success message
         msg = "System Override Complete. Network Access Granted."
-        msg_surf = self.body_font.render(msg, True, self.SUCCESS_GREEN)
+        msg_surf = get_text_surface(self.body_font, msg, self.SUCCESS_GREEN)
         msg_rect = msg_surf.get_rect(center=(center_x, center_y + 20))
         screen.blit(msg_surf, msg_rect)
         
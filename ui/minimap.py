@@ -43,8 +43,8 @@ class Minimap:
                 pygame.draw.rect(screen, color, (mx, my, minimap_tile_size, minimap_tile_size))
         
         # Draw player
-        p_mx = minimap_x + minimap_padding + int(player.x) * minimap_tile_size
-        p_my = minimap_y + minimap_padding + int(player.y) * minimap_tile_size
+        p_mx = minimap_x + minimap_padding + player.x * minimap_tile_size
+        p_my = minimap_y + minimap_padding + player.y * minimap_tile_size
         pygame.draw.circle(screen, CYAN, (p_mx + minimap_tile_size // 2, p_my + minimap_tile_size // 2), 3)
         
         # Draw all enemies
@@ -4,6 +4,7 @@ Shadow selection menu UI.
 import pygame
 from config.settings import SHADOW_TYPES, RESPONSIVE_SCALE
 from config.constants import CYAN, WHITE, YELLOW, RED
+from managers.font_cache import get_font
 
 class ShadowMenu:
     """Shadow selection menu overlay."""
@@ -46,7 +47,7 @@ class ShadowMenu:
                 player.resources -= type_config['cost']
                 # Import here to avoid circular dependency
                 from entities import Shadow
-                shadow = Shadow(int(player.x), int(player.y), shadow_type=selected_type)
+                shadow = Shadow(player.x, player.y, shadow_type=selected_type)
                 shadows.append(shadow)
                 sound_manager.play('build')
             self.close()
@@ -102,23 +103,24 @@ class ShadowMenu:
                 # Scale image to fit card
                 img_display_size = int(120 * RESPONSIVE_SCALE)
                 if shadow_img.get_width() > 0 and shadow_img.get_height() > 0:
-                    shadow_scaled = pygame.transform.scale(shadow_img, (img_display_size, img_display_size))
+                    shadow_size = img_display_size
                     
                     # Add scale effect on hover
                     if is_selected:
                         scale_factor = 1.15
-                        shadow_scaled = pygame.transform.scale(shadow_img, (int(img_display_size * scale_factor), int(img_display_size * scale_factor)))
+                        shadow_size = int(img_display_size * scale_factor)
                         # Add glow effect
                         glow_surface = pygame.Surface((int(img_display_size * scale_factor + 20), int(img_display_size * scale_factor + 20)), pygame.SRCALPHA)
                         pygame.draw.circle(glow_surface, (0, 200, 255, 100), (int(img_display_size * scale_factor + 10) // 2, int(img_display_size * scale_factor + 10) // 2), int(img_display_size * scale_factor // 2 + 10))
                         screen.blit(glow_surface, (card_x + card_width // 2 - int(img_display_size * scale_factor + 20) // 2, card_y + int(30 * RESPONSIVE_SCALE) - 10))
                     
+                    shadow_scaled = self.assets.get_resized(shadow_type, (shadow_size, shadow_size))
                     img_x = card_x + card_width // 2 - shadow_scaled.get_width() // 2
                     img_y = card_y + int(30 * RESPONSIVE_SCALE)
                     screen.blit(shadow_scaled, (img_x, img_y))
             
             # Shadow name
-            name_font = self.font if not is_selected else pygame.font.SysFont('Arial', max(18, int(22 * RESPONSIVE_SCALE)), bold=True)
+            name_font = self.font if not is_selected else get_font('Arial', max(18, int(22 * RESPONSIVE_SCALE)), bold=True)
             name_color = YELLOW if is_selected else WHITE
             name_text = name_font.render(config['name'], True, name_color)
             name_x = card_x + card_width // 2 - name_text.get_width() // 2
@@ -4,6 +4,7 @@ Trap selection menu UI.
 import pygame
 from config.settings import TRAP_TYPES, RESPONSIVE_SCALE
 from config.constants import CYAN, WHITE, YELLOW, RED
+from managers.font_cache import get_font
 
 class TrapMenu:
     """Trap selection menu overlay."""
@@ -116,19 +117,18 @@ class TrapMenu:
                 # Scale image
                 img_display_size = int(100 * RESPONSIVE_SCALE)
                 if img.get_width() > 0:
-                    scaled = pygame.transform.scale(img, (img_display_size, img_display_size))
-                    
                     if is_selected:
                         # Scale up
                         scale_factor = 1.15
-                        scaled = pygame.transform.scale(img, (int(img_display_size * scale_factor), int(img_display_size * scale_factor)))
+                        img_display_size = int(img_display_size * scale_factor)
+                    scaled = self.assets.get_resized(trap_type, (img_display_size, img_display_size))
                     
                     img_x = card_x + card_width // 2 - scaled.get_width() // 2
                     img_y = card_y + int(30 * RESPONSIVE_SCALE)
                     screen.blit(scaled, (img_x, img_y))
             
             # Name
-            name_font = self.font if not is_selected else pygame.font.SysFont('Arial', max(18, int(22 * RESPONSIVE_SCALE)), bold=True)
+            name_font = self.font if not is_selected else get_font('Arial', max(18, int(22 * RESPONSIVE_SCALE)), bold=True)
             name_color = YELLOW if is_selected else WHITE
             name_text = name_font.render(config['name'], True, name_color)
             name_x = card_x + card_width // 2 - name_text.get_width() // 2